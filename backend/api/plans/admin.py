@@ -1,33 +1,77 @@
 from django.contrib import admin
+from django.contrib.admin.widgets import AdminTextareaWidget
 from django.db import models
+from django.urls import reverse
+from django.utils.html import format_html
 from django_json_widget.widgets import JSONEditorWidget
 from api.plans.models import Plan, Workout
 
 
+class UserEmailFilter(admin.SimpleListFilter):
+    """
+    Filter plans by user email, driven by the ?user_email= query parameter.
+
+    Unlike a plain ``list_filter = ('user',)``, this never renders a choice per
+    user, so the changelist doesn't load the whole user table.
+    """
+    title = 'user email'
+    parameter_name = 'user_email'
+
+    def lookups(self, request, model_admin):
+        # Only expose the active value so the filter stays applied without
+        # listing every user in the sidebar.
+        value = self.value()
+        return ((value, value),) if value else ()
+
+    def queryset(self, request, queryset):
+        value = self.value()
+        if value:
+            return queryset.filter(user__email__icontains=value)
+        return queryset
+
+
 class WorkoutInline(admin.TabularInline):
     """
     Inline admin for Workouts within a Plan
+
+    Shows the columns denormalized from workout_info next to the JSON itself,
+    which new workouts need when they're added inline.
     """
     model = Workout
     extra = 0
-    fields = ('date', 'completion_status', 'difficulty', 'additional_notes', 'workout_info')
-    readonly_fields = ('id',)
+    fields = (
+        'date', 'workout_type', 'duration_min', 'completion_status',
+        'difficulty', 'additional_notes', 'workout_info', 'view_workout_link',
+    )
+    readonly_fields = ('id', 'workout_type', 'duration_min', 'view_workout_link')
 
-    def formfield_for_dbfield(self, db_field, **kwargs):
-        formfield = super().formfield_for_dbfield(db_field, **kwargs)
+    def get_queryset(self, request):
+        """
+        The plan is joined (without its plan_info) because each row renders
+        str(workout).
+        """
+        return super().get_queryset(request).select_related('plan').defer('plan__plan_info')
 
-        if db_field.name == 'workout_info':
-            formfield.widget = JSONEditorWidget(options={'mode': 'code'})
-            formfield.widget.attrs['style'] = 'width: 800px; min-width: 800px; height: 300px;'  # Add height here
+    # additional_notes is the only editable TextField inline
+    formfield_overrides = {
+        models.TextField: {'widget': AdminTextareaWidget(attrs={
+            'cols': '20',
+            'rows': '2',
+            'style': 'max-width: 200px;'
+        })},
+        models.JSONField: {'widget': JSONEditorWidget(
+            options={'mode': 'code'},
+            attrs={'style': 'width: 800px; min-width: 800px; height: 300px;'}
+        )},
+    }
 
-        elif db_field.name == 'additional_notes':
-            formfield.widget.attrs.update({
-                'cols': '20',
-                'rows': '2',
-                'style': 'max-width: 200px;'
-            })
+    def view_workout_link(self, obj):
+        if obj.pk:
+            url = reverse("admin:plans_workout_change", args=[obj.pk])
+            return format_html('<a href="{}">Edit Workout</a>', url)
+        return "-"
 
-        return formfield
+    view_workout_link.short_description = "Workout Details"
 
 
 @admin.register(Plan)
@@ -35,16 +79,31 @@ class PlanAdmin(admin.ModelAdmin):
     """
     Admin configuration for the Plan model
     """
-    list_display = ('id', 'user', 'user_id', 'username', 'created_at')
-    list_filter = ('user',)
+    list_display = ('id', 'user', 'user_id', 'username', 'status', 'created_at')
+    list_select_related = ('user',)
+    list_filter = (UserEmailFilter, 'status')
     search_fields = ('user__email',)
-    readonly_fields = ('id', 'created_at')
+    autocomplete_fields = ('user',)
+    readonly_fields = ('id', 'status', 'created_at')
     inlines = [WorkoutInline]
 
     formfield_overrides = {
         models.JSONField: {'widget': JSONEditorWidget},
     }
 
+    def get_queryset(self, request):
+        """
+        Join the user row so the user columns don't issue a query per plan.
+        On the changelist, only load the columns that are actually displayed,
+        which leaves the plan_info JSON out of the query.
+        """
+        queryset = super().get_queryset(request).select_related('user')
+        if request.resolver_match and request.resolver_match.url_name == 'plans_plan_changelist':
+            queryset = queryset.only(
+                'id', 'status', 'created_at', 'user_email_cached', 'user', 'user__id', 'user__username', 'user__first_name', 'user__email'
+            )
+        return queryset
+
     def user_id(self, obj):
         """
         Display the user ID in the admin.
@@ -60,3 +119,33 @@ class PlanAdmin(admin.ModelAdmin):
         return obj.user.first_name
     username.admin_order_field = 'user__first_name'
     username.short_description = 'Username'
+
+
+@admin.register(Workout)
+class WorkoutAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the Workout model
+    """
+    list_display = ('id', 'plan', 'date', 'workout_type', 'duration_min', 'completion_status')
+    list_select_related = ('plan',)
+    list_filter = ('completion_status',)
+    search_fields = ('plan__user__email',)
+    readonly_fields = ('id', 'workout_type', 'duration_min', 'created_at')
+    autocomplete_fields = ('plan',)
+
+    def get_queryset(self, request):
+        """
+        The changelist only shows the denormalized columns, so leave out the
+        workout_info JSON and the joined plan's plan_info.
+        """
+        queryset = super().get_queryset(request)
+        if request.resolver_match and request.resolver_match.url_name == 'plans_workout_changelist':
+            queryset = queryset.select_related('plan').defer('workout_info', 'plan__plan_info')
+        return queryset
+
+    formfield_overrides = {
+        models.JSONField: {'widget': JSONEditorWidget(
+            options={'mode': 'code'},
+            attrs={'style': 'width: 800px; min-width: 800px; height: 300px;'}
+        )},
+    }
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.13 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+def populate_status(apps, schema_editor):
+    """Backfill the stored status from the generation fields."""
+    Plan = apps.get_model('plans', 'Plan')
+    Plan.objects.filter(generation_error__isnull=False).update(status='error')
+    Plan.objects.filter(
+        generation_completed_at__isnull=False,
+        status='in progress',
+    ).update(status='completed')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plans', '0005_remove_workout_is_completed_workout_additional_notes_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='plan',
+            name='status',
+            field=models.CharField(choices=[('in progress', 'In progress'), ('completed', 'Completed'), ('error', 'Error')], db_index=True, default='in progress', editable=False, max_length=16),
+        ),
+        migrations.RunPython(populate_status, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.13 on 2026-10-16 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plans', '0006_plan_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='workout',
+            index=models.Index(fields=['plan', 'date'], name='workout_plan_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workout',
+            index=models.Index(fields=['plan', '-created_at'], name='workout_plan_created_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.13 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plans', '0007_workout_plan_date_idx_workout_plan_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='plan',
+            index=models.Index(fields=['user', '-created_at'], name='plan_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='plan',
+            index=models.Index(fields=['user', 'status'], name='plan_user_status_idx'),
+        ),
+    ]
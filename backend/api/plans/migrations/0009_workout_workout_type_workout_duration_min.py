@@ -0,0 +1,60 @@
+# Generated by Django 4.2.13 on 2026-10-16 10:30
+
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+
+def parse_duration_minutes(value):
+    """
+    Parse the LLM-provided workout duration into whole minutes.
+
+    A frozen copy of the helper in api.plans.models, so this migration keeps
+    its behaviour if that one changes.
+    """
+    if isinstance(value, bool) or value is None:
+        return None
+    try:
+        minutes = int(float(value))
+    except (TypeError, ValueError):
+        return None
+    return minutes if 0 <= minutes <= 32767 else None
+
+
+def populate_workout_info_fields(apps, schema_editor):
+    """Backfill workout_type and duration_min from workout_info."""
+    Workout = apps.get_model('plans', 'Workout')
+    batch = []
+    # Stream the rows (server-side cursor on PostgreSQL) and write them back in
+    # batches so memory stays bounded regardless of the table size.
+    for workout in Workout.objects.only('id', 'workout_info').iterator(chunk_size=BATCH_SIZE):
+        workout_info = workout.workout_info if isinstance(workout.workout_info, dict) else {}
+        workout.workout_type = str(workout_info.get('type') or '')[:32]
+        workout.duration_min = parse_duration_minutes(workout_info.get('duration'))
+        batch.append(workout)
+        if len(batch) >= BATCH_SIZE:
+            Workout.objects.bulk_update(batch, ['workout_type', 'duration_min'])
+            batch = []
+    if batch:
+        Workout.objects.bulk_update(batch, ['workout_type', 'duration_min'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plans', '0008_plan_plan_user_created_idx_plan_user_status_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workout',
+            name='workout_type',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=32),
+        ),
+        migrations.AddField(
+            model_name='workout',
+            name='duration_min',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(populate_workout_info_fields, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.13 on 2026-10-16 11:00
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def populate_user_email_cached(apps, schema_editor):
+    """Backfill the email snapshot from the owning user."""
+    Plan = apps.get_model('plans', 'Plan')
+    User = apps.get_model('users', 'User')
+    Plan.objects.update(
+        user_email_cached=Subquery(User.objects.filter(pk=OuterRef('user_id')).values('email')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0010_profile_timezone'),
+        ('plans', '0009_workout_workout_type_workout_duration_min'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='plan',
+            name='user_email_cached',
+            field=models.EmailField(blank=True, default='', editable=False, max_length=254),
+        ),
+        migrations.RunPython(populate_user_email_cached, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.13 on 2026-10-16 11:30
+
+import api.utils.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plans', '0010_plan_user_email_cached'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='plan',
+            name='id',
+            field=models.UUIDField(default=api.utils.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='workout',
+            name='id',
+            field=models.UUIDField(default=api.utils.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.13 on 2026-10-16 14:00
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Q, Subquery
+
+PENDING = Q(generation_completed_at__isnull=True, generation_error__isnull=True)
+
+
+def fail_duplicate_pending_plans(apps, schema_editor):
+    """
+    Keep only the newest in-progress plan per user so the constraint can be
+    added; older ones can't still be generating and are marked as errored.
+    """
+    Plan = apps.get_model('plans', 'Plan')
+    newest_pending = Plan.objects.filter(PENDING, user=OuterRef('user')).order_by('-created_at').values('pk')[:1]
+    Plan.objects.filter(PENDING).exclude(pk=Subquery(newest_pending)).update(
+        generation_error='Superseded by a newer plan generation',
+        status='error',
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('plans', '0011_alter_plan_id_alter_workout_id'),
+    ]
+
+    operations = [
+        migrations.RunPython(fail_duplicate_pending_plans, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='plan',
+            constraint=models.UniqueConstraint(condition=models.Q(('generation_completed_at__isnull', True), ('generation_error__isnull', True)), fields=('user',), name='one_inflight_plan_per_user'),
+        ),
+    ]
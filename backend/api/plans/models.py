@@ -1,9 +1,51 @@
-import uuid
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.conf import settings
+from django.dispatch import receiver
+from django.db.models import Q
+from django.db.models.signals import post_save
 from django.utils.timezone import now
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from api.utils.ids import uuid7
+
+
+def parse_duration_minutes(value):
+    """
+    Parse the LLM-provided workout duration into whole minutes.
+
+    Returns None when the value is missing or not a usable number.
+    """
+    if isinstance(value, bool) or value is None:
+        return None
+    try:
+        minutes = int(float(value))
+    except (TypeError, ValueError):
+        return None
+    return minutes if 0 <= minutes <= 32767 else None
+
+
+class PlanQuerySet(models.QuerySet):
+    """QuerySet helpers for Plan."""
+
+    def create_pending(self, user):
+        """
+        Create a new in-progress plan for a user, unless one already exists.
+
+        Relies on the one_inflight_plan_per_user constraint rather than a
+        check-then-insert, so concurrent requests can't both get a plan.
+
+        Returns:
+            The new Plan, or None if a generation is already in progress
+        """
+        plan = self.model(user=user)
+        try:
+            with transaction.atomic():
+                # The constraint is the check, so skip full_clean's query for it
+                plan.save(force_insert=True, skip_validation=True)
+        except IntegrityError:
+            return None
+        return plan
+
 
 class Plan(models.Model):
     """
@@ -12,7 +54,12 @@ class Plan(models.Model):
     A plan is associated with a single user and contains training information
     in the plan_info JSONField. It can have multiple workouts.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    class Status(models.TextChoices):
+        IN_PROGRESS = "in progress", "In progress"
+        COMPLETED = "completed", "Completed"
+        ERROR = "error", "Error"
+
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE, 
@@ -22,54 +69,105 @@ class Plan(models.Model):
     generation_completed_at = models.DateTimeField(null=True, blank=True)
     generation_error = models.TextField(null=True, blank=True)
     plan_info = models.JSONField(null=True, blank=True)
+    # Snapshot of the owner's email so __str__ doesn't need to fetch the user.
+    # sync_plan_user_email keeps it in step with User.email.
+    user_email_cached = models.EmailField(blank=True, default='', editable=False)
+    # Derived from generation_error / generation_completed_at on every save so
+    # it can be filtered and indexed in the database.
+    status = models.CharField(
+        max_length=16,
+        choices=Status.choices,
+        default=Status.IN_PROGRESS,
+        editable=False,
+        db_index=True,
+    )
+    
+    objects = PlanQuerySet.as_manager()
     
     class Meta:
         """Meta options for the Plan model."""
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at'], name='plan_user_created_idx'),
+            models.Index(fields=['user', 'status'], name='plan_user_status_idx'),
+        ]
+        constraints = [
+            # At most one plan per user can be generating. The partial unique
+            # index only holds unfinished plans and also serves the
+            # in-progress lookups.
+            models.UniqueConstraint(
+                fields=['user'],
+                name='one_inflight_plan_per_user',
+                condition=Q(generation_completed_at__isnull=True, generation_error__isnull=True),
+            ),
+        ]
     
     def __str__(self):
         """String representation of the Plan model."""
-        return f"Plan for {self.user.email}"
+        return f"Plan for {self.user_email_cached or self.user_id}"
     
     def clean(self):
         """Validate the model as a whole."""
         super().clean()
         # Additional validation can be added here if needed
     
-    def save(self, *args, **kwargs):
-        """Override save to ensure model validation before saving."""
-        self.full_clean()
+    def save(self, *args, skip_validation=False, **kwargs):
+        """
+        Override save to keep status in sync and validate the model.
+
+        Pass skip_validation=True from paths whose data was already validated
+        (e.g. by a serializer) to avoid running full_clean twice.
+        """
+        self.status = self.compute_status()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'generation_error', 'generation_completed_at'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'status'}
+        # Refresh the email snapshot when it's missing or the user is already loaded
+        if self.user_id and (not self.user_email_cached or Plan.user.is_cached(self)):
+            self.user_email_cached = self.user.email
+        if not skip_validation:
+            self.full_clean()
         super().save(*args, **kwargs)
         
-    @property
-    def status(self):
+    def compute_status(self):
         """
         Determines the status of the plan based on generation state.
+
+        Uses the same null checks as the one_inflight_plan_per_user
+        constraint, so a plan is in progress exactly when the constraint
+        counts it.
         """
-        if self.generation_error:
-            return "error"
-        elif self.generation_completed_at:
-            return "completed"
+        if self.generation_error is not None:
+            return self.Status.ERROR
+        elif self.generation_completed_at is not None:
+            return self.Status.COMPLETED
         else:
-            return "in progress"
+            return self.Status.IN_PROGRESS
     
     def set_error(self, error_message):
         """
         Sets an error message for the plan and clears generation_completed_at.
         This ensures the status is marked as 'error'.
         """
-        self.generation_error = error_message
-        self.generation_completed_at = None
-        self.save()
+        self._update_generation_state(generation_error=error_message, generation_completed_at=None)
 
     def mark_as_completed(self):
         """
         Marks the plan as completed by setting generation_completed_at to the current datetime.
         Clears any previous error.
         """
-        self.generation_completed_at = now()
-        self.generation_error = None
-        self.save()
+        self._update_generation_state(generation_completed_at=now(), generation_error=None)
+
+    def _update_generation_state(self, **fields):
+        """
+        Write the generation fields and the derived status with a single
+        UPDATE, skipping full_clean and the rest of the row, then mirror the
+        change on this instance.
+        """
+        for name, value in fields.items():
+            setattr(self, name, value)
+        self.status = fields['status'] = self.compute_status()
+        Plan.objects.filter(pk=self.pk).update(**fields)
 
 
 class Workout(models.Model):
@@ -85,7 +183,7 @@ class Workout(models.Model):
         SKIPPED = "skipped", "Skipped"
         NOT_COMPLETED = "not_completed", "Not completed"
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     plan = models.ForeignKey(
         'Plan',
         on_delete=models.CASCADE,
@@ -93,6 +191,9 @@ class Workout(models.Model):
     )
     date = models.DateField()
     workout_info = models.JSONField()
+    # Denormalized from workout_info so list pages don't need to parse the JSON
+    workout_type = models.CharField(max_length=32, blank=True, default='', editable=False, db_index=True)
+    duration_min = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     
     completion_status = models.CharField(
@@ -111,22 +212,68 @@ class Workout(models.Model):
     
     class Meta:
         """Meta options for the Workout model."""
-        ordering = ['-created_at']
+        ordering = ['date']
+        indexes = [
+            models.Index(fields=['plan', 'date'], name='workout_plan_date_idx'),
+            models.Index(fields=['plan', '-created_at'], name='workout_plan_created_idx'),
+        ]
     
     def __str__(self):
         """String representation of the Workout model."""
-        return f"Workout {self.id} on {self.date} for {self.plan.user.email}"
+        return f"Workout {self.id} on {self.date} for {self.plan.user_email_cached or self.plan.user_id}"
     
     def clean(self):
         """Validate the model as a whole."""
         super().clean()
         # Additional validation can be added here if needed
     
-    def save(self, *args, **kwargs):
-        """Override save to ensure model validation before saving."""
-        self.full_clean()
+    def save(self, *args, skip_validation=False, **kwargs):
+        """
+        Override save to ensure model validation before saving.
+
+        Pass skip_validation=True from paths whose data was already validated
+        (e.g. by a serializer) to avoid running full_clean twice.
+        """
+        # Deferred fields weren't modified, so there's nothing to sync or validate
+        deferred_fields = self.get_deferred_fields()
+        if 'workout_info' not in deferred_fields:
+            self.sync_workout_info_fields()
+        if not skip_validation:
+            self.full_clean(exclude=deferred_fields)
         super().save(*args, **kwargs)
-    
-    class Meta:
-        """Meta options for the Workout model."""
-        ordering = ['date']
\ No newline at end of file
+
+    def sync_workout_info_fields(self):
+        """Copy the values read by list pages out of workout_info."""
+        workout_info = self.workout_info if isinstance(self.workout_info, dict) else {}
+        self.workout_type = str(workout_info.get('type') or '')[:32]
+        self.duration_min = parse_duration_minutes(workout_info.get('duration'))
+
+    @classmethod
+    def bulk_create_for_plan(cls, plan, workouts, batch_size=500):
+        """
+        Create the workouts of a plan with batched multi-row INSERTs.
+
+        Args:
+            plan: Plan the workouts belong to
+            workouts: Iterable of dicts with the Workout field values
+
+        Note that bulk_create bypasses save(), so the input is expected to be
+        validated by the caller.
+        """
+        objs = [cls(plan=plan, **workout) for workout in workouts]
+        for obj in objs:
+            obj.sync_workout_info_fields()
+        return cls.objects.bulk_create(objs, batch_size=batch_size)
+
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def sync_plan_user_email(sender, instance=None, created=False, raw=False, update_fields=None, **kwargs):
+    """
+    Copy a changed user email onto the snapshot kept on the user's plans.
+    """
+    if created or raw or (update_fields is not None and 'email' not in update_fields):
+        return
+    Plan.objects.filter(user=instance).exclude(user_email_cached=instance.email).update(
+        user_email_cached=instance.email
+    )
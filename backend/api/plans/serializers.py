@@ -1,3 +1,4 @@
+from django.db.models.fields.json import KeyTransform
 from rest_framework import serializers
 from api.plans.models import Plan, Workout
 
@@ -7,28 +8,66 @@ class PlanSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Plan
-        fields = '__all__'
-        
+        fields = (
+            'id', 'user', 'created_at', 'generation_completed_at',
+            'generation_error', 'status', 'plan_info',
+        )
+
 
 class WorkoutSerializer(serializers.ModelSerializer):
     """Serializer for the Workout model."""
     
     class Meta:
         model = Workout
-        fields = '__all__'
+        fields = (
+            'id', 'plan', 'date', 'created_at', 'completion_status',
+            'difficulty', 'additional_notes', 'workout_info',
+        )
         read_only_fields = ['workout_info', 'date', 'plan', 'id', 'created_at']
     
-    def validate_completion_status(self, value):
-        """Validate that completion_status is one of the allowed values."""
-        allowed_values = [choice[0] for choice in Workout.CompletionStatus.choices]
-        if value not in allowed_values:
-            raise serializers.ValidationError(
-                f"completion_status must be one of {allowed_values}"
-            )
-        return value
-    
-    def validate_difficulty(self, value):
-        """Validate that difficulty is between 1 and 10."""
-        if value is not None and (value < 1 or value > 10):
-            raise serializers.ValidationError("difficulty must be between 1 and 10")
-        return value
\ No newline at end of file
+    def update(self, instance, validated_data):
+        """
+        Save only the changed fields. The serializer has already run the
+        model field validators, so model validation is skipped.
+        """
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=list(validated_data), skip_validation=True)
+        return instance
+
+
+class WorkoutSummarySerializer(serializers.ModelSerializer):
+    """
+    Lean serializer for workout lists.
+
+    Only the workout_info keys rendered by the plan calendar are returned;
+    the full steps and fueling tips are served by the workout detail endpoint.
+    Querysets must go through prepare_queryset() first.
+    """
+    # Read straight from the JSON rather than from workout_type/duration_min,
+    # so the values match what the detail endpoint returns
+    JSON_KEYS = ('type', 'title', 'summary', 'duration', 'distance')
+
+    workout_info = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Workout
+        fields = (
+            'id', 'plan', 'date', 'created_at', 'completion_status',
+            'difficulty', 'additional_notes', 'workout_info',
+        )
+        read_only_fields = fields
+
+    @classmethod
+    def prepare_queryset(cls, queryset):
+        """
+        Leave the workout_info JSON out of the query and have the database
+        extract just the summary keys.
+        """
+        return queryset.defer('workout_info').annotate(**{
+            f'info_{key}': KeyTransform(key, 'workout_info') for key in cls.JSON_KEYS
+        })
+
+    def get_workout_info(self, obj):
+        """Return the subset of workout_info needed to render a list item."""
+        return {key: getattr(obj, f'info_{key}') for key in self.JSON_KEYS}
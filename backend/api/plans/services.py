@@ -3,1119 +3,59 @@ import json
 import threading
 import traceback
 import datetime
-from pytz import timezone
+from pathlib import Path
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
-from langchain.chat_models import init_chat_model
 
 from django.conf import settings
-from django.core.exceptions import ValidationError
+from django.contrib.auth import get_user_model
 from django.db import transaction
 
 from api.utils.parsing import parse_yaml_response_content
-from api.plans.models import Plan, Workout
+from api.plans.models import Workout
 from api.users.services import TwilioMessagingService
 from api.utils.tracing import get_langfuse_handler
 from api.utils.mixpanel_service import MixpanelService
 from api.users.serializers import ProfileSerializer
 
 
-logging.basicConfig(
-    level=logging.DEBUG,  # or INFO as needed
-    format="%(levelname)s %(asctime)s %(module)s %(message)s",
-    handlers=[logging.StreamHandler()],
-)
 logger = logging.getLogger(__name__)
 
-KNOWLEDGE_BASE_PROMPT = """
 
+@lru_cache(maxsize=64)
+def get_timezone(name):
+    """Return the ZoneInfo for an IANA timezone name, cached per process."""
+    return ZoneInfo(name)
 
-<BOOK name="Run healthy : the runner’s guide to injury prevention and treatment" authors="Emmi Aguillard, Jonathan Cane, Allison Goldstein.">
 
-# High-Level Training Principles for Injury Prevention
+@lru_cache(maxsize=8)
+def get_chat_model(model_name, model_provider):
+    """
+    Return the chat model (with retries) for a model name and provider.
 
-- **Tissue Adaptation:** Muscles recover in 2-4 weeks, tendons take 3-6 months, and bones require 8-12 weeks for full healing.
-- **Mileage Progression:** Limit increases to ≤10% per week to prevent overuse injuries.
-- **Strength Training:** Minimum 2x per week, focusing on progressive loading (≥1.5x body weight for key lifts) to improve tissue resilience and reduce injury risk.
-- **Pain Scale Guidance:** If pain is <3/10, modify but continue activity; 3-5/10, reduce intensity; >5/10, stop and assess.
-- **Cross-Training:** Use swimming, cycling, or elliptical training to maintain fitness while reducing impact on injuries.
-- **Biomechanics & Cadence:** Increase cadence by 5-10% if experiencing knee pain; maintain 5-7° forward lean while running for optimal spinal alignment.
-- **Recovery & Mobility:** Foam rolling, massage, and mobility drills (5-10 min daily) improve movement efficiency and reduce stiffness.
+    The model is shared by every generation in the process so its HTTP client
+    and connection pool are reused; per-call state such as callbacks is passed
+    through the invoke config instead.
+    """
+    # Imported here so processes that never generate a plan don't load langchain
+    from langchain.chat_models import init_chat_model
 
-## Chapter 1: Understanding the Body's Tissues and Their Healing Processes
+    model = init_chat_model(
+        model_name,
+        model_provider=model_provider
+    )
+    return model.with_retry(
+        retry_if_exception_type=(Exception,),
+        stop_after_attempt=3,
+        wait_exponential_jitter=True
+    )
 
-### Key Training Rules:
-- Different tissues heal at different rates; muscles recover faster than tendons and bones due to higher blood supply.
-- Controlled stress (gradual loading) promotes healing; complete rest is rarely the best approach.
-- Tissue resilience improves with strength training (minimum 2x per week) and proper nutrition.
 
-### Relevant Exercises:
-- **Isometric Holds** (30s x 3 sets) – Initiates muscle recovery without excessive strain.
-- **Eccentric Loading** (3-4 sets, 8-10 reps) – Encourages tendon adaptation.
-- **Gentle Mobility Work** (5 min daily) – Supports blood flow for better healing.
-
-### AI Integration:
-- AI can assess tissue healing rates based on training data, recommend progression loads, and detect overuse risks.
-
-## Chapter 2: Navigating Your Treatment Options
-
-### Key Training Rules:
-- Pain <3/10? Keep training but modify load.
-- Pain 3-5/10? Reduce impact and cross-train.
-- Pain >5/10? Seek professional guidance.
-- Ice for 10-15 minutes every 1-2 hours post-acute injury; heat for muscle tension.
-
-### Relevant Exercises & Treatments:
-- **Pain Scale Monitoring** – Helps decide whether to keep training or rest.
-- **Soft Tissue Mobilization** (2 min per muscle group) – Aids recovery.
-- **Isometric & Controlled Movements** (5-10 sec holds, 3x per session) – Gradual return to activity.
-
-### AI Integration:
-- AI-driven pain logging and training adaptation based on wearable data.
-
-## Chapter 3: Injuries to Muscle and Bone
-
-### Key Training Rules:
-- Muscle tears (Grade 1-3) take 2-12 weeks depending on severity.
-- Stress fractures require 6-12 weeks of offloading before return to impact activities.
-- Strength training should include progressive loading (≥1.5x body weight for key lifts).
-
-### Relevant Exercises & Workouts:
-- **Eccentric Strength Training** (3-4 sets, 8 reps) – For tendon and muscle rehabilitation.
-- **Progressive Weight-Bearing Activities** – Necessary for stress fracture recovery.
-- **Plyometrics** (2x per week) – Enhances resilience once healed.
-
-### AI Integration:
-- AI monitors stress load and suggests gradual return-to-run plans based on bone healing indicators.
-
-## Chapter 4: Soft Tissue Maintenance
-
-### Key Training Rules:
-- Foam rolling (30-60 sec per muscle group) reduces tightness.
-- Massage guns (2-3 min per muscle group) enhance recovery.
-- Self-massage with lacrosse balls (1 min per tight spot) targets deep restrictions.
-
-### Relevant Techniques:
-- **Foam Rolling & Massage Therapy** – Enhances blood flow.
-- **Compression Boots** (15-30 min post-workout) – Improves circulation.
-
-### AI Integration:
-- AI schedules recovery sessions based on HRV and training loads.
-
-## Chapter 5: Feet and Toes
-
-### Key Training Rules:
-- Foot strength improves running efficiency and injury resistance.
-- Minimalist shoe transition should take 8-12 weeks for adaptation.
-- Limit orthotic use to <50% of weekly mileage unless medically necessary.
-
-### Relevant Exercises & Workouts:
-- **Toe Yoga** (10 reps, 3x daily) – Strengthens intrinsic foot muscles.
-- **Balance Work** (30s single-leg holds, 3x per leg) – Improves ankle stability.
-- **Arch Activation** (Short Foot Exercise, 10x per foot) – Develops foot control.
-
-### AI Integration:
-- AI analyzes foot strike patterns and suggests footwear adjustments.
-
-## Chapter 6: Ankles
-
-### Key Training Rules:
-- Recurrent sprains require 4-6 weeks of balance training to restore function.
-- Mobility before strength: Ensure ≥10° dorsiflexion for proper gait mechanics.
-
-### Relevant Exercises & Workouts:
-- **Eccentric Calf Raises** (3x15 reps, slow lowering) – Strengthens the Achilles tendon.
-- **Balance Training** (Eyes closed, 20s single-leg hold) – Enhances proprioception.
-
-### AI Integration:
-- AI detects gait imbalances and prescribes ankle rehab drills.
-
-## Chapter 7: Knees
-
-### Key Training Rules:
-- Quad-to-hamstring strength ratio should be ~60:40.
-- Increase cadence by 5-10% to reduce knee load.
-- Avoid >10% mileage increases per week to prevent runner's knee.
-
-### Relevant Exercises & Workouts:
-- **Monster Walks** (3x15 steps each way) – Strengthens hip stabilizers.
-- **Eccentric Squats** (3x8-10 reps) – Strengthen knee tendons.
-
-### AI Integration:
-- AI monitors cadence and knee strain to suggest form corrections.
-
-## Chapter 8: Hips
-
-### Key Training Rules:
-- Glute strength should be >1.5x body weight in a hip thrust for optimal performance.
-- Hip drop >5° during gait increases knee and back injury risk.
-
-### Relevant Exercises & Workouts:
-- **Hip Floss & 3D Pivots** (3x each direction) – Improve hip rotation.
-- **Single-Leg Romanian Deadlifts** (3x8 reps per leg) – Strengthen posterior chain.
-
-### AI Integration:
-- AI analyzes hip angles in gait and provides stabilization drills.
-
-## Chapter 9: Low Back
-
-### Key Training Rules:
-- Core should be trained 2-3x per week to prevent back injuries.
-- Maintain a forward lean of ~5-7° while running for optimal spinal alignment.
-
-### Relevant Exercises & Workouts:
-- **All-Four Belly Lift** (5 breaths, 3x per session) – Activates deep core.
-- **Plank with Hip Drivers** (3x30s each direction) – Builds spinal stability.
-- **Thoracic Mobility Work** (3-5 min daily) – Reduces excessive lumbar stress.
-
-### AI Integration:
-- AI detects posture trends and recommends form adjustments.
-
-## Chapter 10: Plantar Fasciitis
-
-### Key Training Rules:
-- Gradual loading is essential; avoid complete rest as it can worsen stiffness.
-- Modify training to include low-impact activities like swimming or cycling.
-- Ensure proper footwear with good arch support and a low heel-to-toe drop (<8mm).
-
-### Relevant Exercises & Workouts:
-- **Foot Rolling** (2 min each foot) – Reduces tension in the plantar fascia.
-- **Toe Stretch & Big Toe Extension** (10 reps, 3x per day) – Improves foot mobility.
-- **Calf Stretch & Eccentric Heel Drops** (3x15 reps, slow lowering) – Relieves tightness contributing to plantar fasciitis.
-
-### AI Integration:
-- AI analyzes foot strike patterns and gait imbalances to detect plantar overload risks.
-
-## Chapter 11: Achilles Tendinitis
-
-### Key Training Rules:
-- Eccentric loading is crucial for Achilles recovery (avoid explosive movements too soon).
-- Avoid increasing mileage by more than 5% per week when returning from injury.
-- Run on softer surfaces like trails or grass to reduce tendon stress.
-
-### Relevant Exercises & Workouts:
-- **Eccentric Calf Raises** (3x15 reps per leg) – Strengthens the Achilles tendon.
-- **Ankle Mobility Drills** (2-3 min per session) – Improves dorsiflexion.
-- **Single-Leg Balance Work** (30s per leg, 3x per day) – Enhances stability.
-
-### AI Integration:
-- AI monitors ground impact forces and suggests gradual tendon loading progressions.
-
-## Chapter 12: Shin Splints
-
-### Key Training Rules:
-- Increase cadence to 170-180 steps per minute to reduce lower leg strain.
-- Strengthen the tibialis anterior to reduce shin overload.
-- Ice for 15 minutes post-run to manage inflammation.
-
-### Relevant Exercises & Workouts:
-- **Heel Walks** (30s x 3 rounds) – Strengthens the tibialis anterior.
-- **Eccentric Calf Raises** (3x15 reps) – Improves shock absorption.
-- **Foam Rolling** (2 min per leg) – Reduces tightness in the calves.
-
-### AI Integration:
-- AI detects excessive braking forces in gait analysis and suggests stride adjustments.
-
-## Chapter 13: Hamstring Tendinitis & Tendinopathy
-
-### Key Training Rules:
-- Avoid static stretching before running; focus on dynamic warm-ups instead.
-- Load the hamstrings with isometric and eccentric exercises to prevent strain.
-- Gradually return to sprinting and hill running over 4-6 weeks.
-
-### Relevant Exercises & Workouts:
-- **Nordic Hamstring Curls** (3x5 reps, slow lowering) – Builds hamstring strength.
-- **Single-Leg Deadlifts** (3x8 per leg) – Enhances posterior chain activation.
-- **Glute Bridges** (3x15 reps) – Reduces over-reliance on hamstrings.
-
-### AI Integration:
-- AI monitors running speed and stride length to detect excessive hamstring load.
-
-## Chapter 14: IT Band Syndrome
-
-### Key Training Rules:
-- Increase glute strength to prevent excessive hip drop (>5° is a risk factor).
-- Avoid downhill running if experiencing IT band pain.
-- Gradually increase long-run mileage by ≤1 mile per week.
-
-### Relevant Exercises & Workouts:
-- **Lateral Band Walks** (3x15 steps each way) – Strengthens hip stabilizers.
-- **Hip Hikes** (3x10 per side) – Improves pelvic control.
-- **Foam Rolling IT Band & Quads** (2 min per leg) – Reduces tightness.
-
-### AI Integration:
-- AI analyzes hip stability during runs and suggests corrective strength work.
-
-## Chapter 15: Principles of Smart Training
-
-### Key Training Rules:
-- Follow the 80/20 rule: 80% of running should be easy, 20% moderate to hard.
-- Deload every 4th week by reducing mileage by 20-30%.
-- Incorporate at least one rest day per week to allow adaptation.
-
-### AI Integration:
-- AI optimizes weekly training load based on fatigue and adaptation trends.
-
-## Chapter 16: Ideal Running Form
-
-### Key Training Rules:
-- Cadence should be 170-180 steps per minute to reduce impact forces.
-- Maintain a forward lean (~5-7°) to optimize propulsion.
-- Avoid overstriding; ensure foot lands under the center of mass.
-
-### Relevant Drills:
-- **A & B Skips** (3x20m) – Improves knee drive and foot placement.
-- **High Knees** (3x20m) – Enhances running efficiency.
-- **Stride Outs** (4x50m at 85% effort) – Reinforces proper form.
-
-### AI Integration:
-- AI analyzes stride length and foot placement to correct inefficiencies.
-
-## Chapter 17: Nutrition & Fueling
-
-### Key Training Rules:
-- Consume 30-60g of carbs per hour during long runs over 90 minutes.
-- Post-run recovery meal within 30 minutes: 3:1 carb-to-protein ratio.
-- Hydrate with at least 500ml per hour in warm conditions.
-
-### AI Integration:
-- AI suggests meal plans based on training volume and metabolic data.
-
-## Chapter 18: Alternative Therapies & Myth Busting
-
-### Key Training Rules:
-- Cupping, acupuncture, and chiropractic care can aid recovery but should not replace strength training.
-- Cold therapy is useful post-run, but not before training.
-- Massage guns and compression boots can enhance circulation but don't replace mobility work.
-
-### AI Integration:
-- AI recommends recovery techniques based on training stress and HRV trends.
-
-## Final Takeaway:
-- Injury prevention requires progressive loading, mobility, strength, and AI-assisted form analysis.
-- AI coaching dynamically adjusts training plans, recovery, and injury risk assessments.
-- Use specific strength metrics to ensure optimal performance and injury resistance.
-</BOOK>
-
-
-<BOOK name="Daniel's Running Formula" authors="Jack Danield, PhD">
-# Daniels' Running Formula Training Cheat Sheet
-
-## High-Level Training Principles for Running Success
-
-### The Four Ingredients of Running Success
-1. **Inherent Ability** – Your natural physiological and biomechanical traits determine how well you can run.
-2. **Intrinsic Motivation** – Passion and commitment drive long-term improvement.
-3. **Opportunity** – Training environment, access to coaching, and race conditions influence potential.
-4. **Direction** – The quality of training plans and coaching guidance affects performance.
-
-### Daniels' Basic Laws of Running
-1. Every runner has unique abilities – Train to strengthen weaknesses while maximizing strengths.
-2. Maintain a positive mindset – Focus on progress, not setbacks.
-3. Expect ups and downs – Good and bad days are part of the process.
-4. Be flexible in training – Adapt to weather, injury, and fatigue.
-5. Set short- and long-term goals – Small wins pave the way to bigger achievements.
-6. Focus on your own race – Execute your plan without worrying about others.
-7. Most mistakes happen early in races – Don't start too fast.
-8. Training should be rewarding – It's not always fun, but it should always feel productive.
-9. Rest and nutrition are part of training – Prioritize sleep, hydration, and proper fueling.
-10. Don't train when sick or injured – Resting prevents long-term setbacks.
-11. Chronic issues require professional help – If symptoms persist, seek medical guidance.
-12. A good run is never a fluke – It's the result of consistent training.
-
-### General Training Guidelines
-- **VDOT-Based Training**: Adjust intensities using VDOT tables to optimize training paces.
-- **Mileage Progression**: Increase ≤10% per week to avoid overuse injuries.
-- **Training Balance**: 80/20 rule (80% easy running, 20% high-intensity work) optimizes performance.
-- **Rest and Recovery**: Every 4th week, reduce mileage by 20-30% for adaptation.
-- **Pacing & Breathing**: 170-180 steps per minute cadence and 2-2 breathing rhythm improve efficiency.
-- **Peak Racing Strategies**: Adjust pacing based on race distance and altitude conditions.
-
-## Chapter 1: Essentials of Running Success
-
-### Key Training Rules:
-- Success is built on ability, motivation, opportunity, and direction.
-- Training must be structured around individual strengths and weaknesses.
-- Consistency in training is more important than short bursts of intensity.
-- Psychological & sociological factors influence success as much as physiology.
-- Training should maximize benefits while minimizing injury risk.
-
-### AI Integration:
-- AI assesses individual running profiles to personalize training plans.
-
-## Chapter 2: Training Principles and Tips
-
-### The Eight Principles of Training:
-1. **The Body Reacts to Stress** – Adaptation occurs only when training applies the right stimulus.
-2. **Specificity** – Training adaptations are specific to the muscles and systems being stressed.
-3. **Overstress** – Too much training leads to breakdown and injury; stress must be followed by recovery.
-4. **Training Response** – It takes 6-8 weeks to see significant adaptations from a new training load.
-5. **Personal Limits** – Every runner has an upper limit to how much stress they can handle.
-6. **Diminishing Returns** – More training doesn't always yield more improvement.
-7. **Accelerating Setbacks** – Overtraining increases injury risk exponentially.
-8. **Maintenance** – Fitness is easier to maintain than it is to build.
-
-### Key Training Rules:
-- Work-to-rest ratio is essential: for speed work, rest = work duration or longer.
-- Do not overtrain: Training should be rewarding, not exhausting.
-- Increase training intensity only after 4-6 weeks at a given level.
-
-### AI Integration:
-- AI tracks training load and suggests adjustments to prevent burnout.
-
-## Chapter 3: Physiological & Personal Training Profiles
-
-### Key Training Rules:
-- VO2max (oxygen consumption) and running economy are key predictors of performance.
-- Threshold pace = 85-88% of VO2max, critical for endurance gains.
-- Heart rate monitoring can guide effort levels in workouts.
-- Blood lactate threshold improvements lead to better endurance.
-- Runners with better economy can outperform runners with higher VO2max.
-
-### AI Integration:
-- AI analyzes VO2max trends and suggests optimal training zones.
-
-## Chapter 4: Types of Training & Intensities
-
-### Five Primary Training Intensities:
-1. **Easy Runs (E)**: 59-74% of VO2max, essential for aerobic base building.
-2. **Marathon Pace (M)**: 75-84% of VO2max, ideal for long-distance race prep.
-3. **Threshold (T) Runs**: 85-88% of VO2max, improves lactate clearance.
-4. **Interval (I) Training**: 90-100% of VO2max, maximizes aerobic power.
-5. **Repetition (R) Training**: >100% VO2max, builds speed and neuromuscular coordination.
-
-### Key Training Rules:
-- **Long Runs**: Should not exceed 25-30% of weekly mileage or 150 minutes.
-- **Threshold Workouts**: Limit to 10% of weekly mileage or 30 minutes per session.
-- **Interval Training**: Individual work bouts should be 3-5 minutes, not exceeding 8% of weekly mileage.
-- **Repetition Training**: Workouts should include short bursts (30-90s) with full recovery.
-
-### AI Integration:
-- AI prescribes training intensities based on race goals and fitness level.
-
-## Chapter 5: VDOT System of Training
-
-### Key Training Rules:
-- VDOT tables predict race times & training paces based on past performance.
-- Progressive Overload: Increase intensity after 4-6 weeks at the same training load.
-- 6-Second Rule: Interval pace is 6 sec/400m slower than Repetition pace.
-- Longer races favor better running economy over higher VO2max.
-- Taper properly: Reduce mileage while maintaining intensity in the final 2-3 weeks before a goal race.
-
-### AI Integration:
-- AI calculates VDOT scores and optimizes race pacing strategies.
-
-## Chapter 6: Environment & Altitude-Specific Training
-
-### Key Training Rules:
-- For heat adaptation, train 2-3 times per week in warm conditions before a hot race.
-- Altitude training: Reduce interval pace by 3-4 sec/400m, threshold by 10-15 sec/mile.
-- Hydration tracking: Aim for 500-750ml per hour in hot conditions.
-- Layering for cold weather: Dress in moisture-wicking layers, avoid overdressing.
-- Acclimatization takes 10-14 days at altitude for meaningful adaptation.
-
-### AI Integration:
-- AI adjusts training paces based on altitude, weather, and temperature data.
-
-## Chapter 7: Treadmill Training
-
-### Key Training Rules:
-- Increase treadmill incline to 1% to better mimic outdoor running effort.
-- Adjust pacing based on treadmill calibration differences.
-- Use treadmill for precise interval pacing and environmental control.
-- Hydration is crucial indoors as sweat evaporation is reduced.
-- Foot strike and form awareness can be improved using mirrors or video feedback.
-
-### AI Integration:
-- AI integrates treadmill data for real-time pacing analysis.
-
-## Chapter 8: Fitness Training
-
-### Key Training Rules:
-- Base building requires 6-12 weeks of consistent mileage before introducing speedwork.
-- Strength training 2-3x per week prevents injuries.
-- Cross-training (cycling, swimming) can replace up to 20% of weekly mileage.
-- Monitor heart rate and recovery: HRV tracking helps optimize training intensity.
-- Fatigue tracking: Adjust workouts based on sleep quality and soreness levels.
-
-### AI Integration:
-- AI balances mileage and cross-training to optimize fitness gains.
-
-## Chapter 9: Training Breaks & Supplemental Training
-
-### Key Training Rules:
-- Planned rest weeks every 4-6 weeks prevent overtraining.
-- Short layoffs (<2 weeks) require no significant fitness loss.
-- Long layoffs (>4 weeks) require gradual return-to-run protocols.
-- Recovery runs (≤65% VO2max) promote active recovery without additional fatigue.
-- Supplementary training (yoga, mobility drills) enhances flexibility and reduces injury risk.
-
-### AI Integration:
-- AI recommends return-to-run protocols based on injury or time off.
-
-## Chapter 10: Season-Tailored Training
-
-### Key Training Rules:
-- Training should follow a periodized structure, divided into base, pre-competition, competition, and peak phases.
-- Early-season focus: Build aerobic endurance with high mileage and easy runs.
-- Mid-season focus: Shift to race-specific training with intervals and tempo runs.
-- Late-season focus: Fine-tune race readiness with sharpening workouts and tapering.
-
-### Plan Execution:
-- Base phase (8-12 weeks): High mileage, mostly easy running, with some strides.
-- Pre-competition phase (6-8 weeks): Introduce threshold and interval training.
-- Competition phase (4-6 weeks): Race simulations, sharpening workouts.
-- Taper phase (2-3 weeks): Reduce mileage but maintain intensity.
-
-### Common Issues & Adjustments:
-- Fatigue during competition → Extend base phase before increasing intensity.
-- Plateauing performance → Add variability to workouts.
-- Late-season burnout → Adjust taper strategy.
-
-### AI Integration:
-- AI monitors adaptation rates and adjusts phase transitions accordingly.
-
-## Chapter 11: 800-Meter Training
-
-### Key Training Rules:
-- Speed and endurance must be balanced, with both aerobic and anaerobic work.
-- VO2max training (I-pace) and speed endurance (R-pace) are critical.
-- Strength training enhances power and sprint efficiency.
-
-### Plan Execution:
-- Speed development: Short sprints (50-200m) at 95-100% effort.
-- Lactate tolerance workouts: 400-600m reps at race pace.
-- Aerobic support: Threshold runs and long runs (~60 minutes at E-pace).
-- Race simulation: 600m at race pace + 200m sprint.
-
-### Common Issues & Adjustments:
-- Struggling with final 200m → Increase anaerobic capacity with longer sprints.
-- Slow acceleration → Add explosive drills and plyometrics.
-- Early race fatigue → Improve endurance with more threshold work.
-
-### AI Integration:
-- AI analyzes split times and suggests pacing modifications.
-
-## Chapter 12: 1500M to 2-Mile Training
-
-### Key Training Rules:
-- Blend speed and endurance training to maximize race performance.
-- Threshold workouts (T-pace) improve aerobic efficiency.
-- Sprint mechanics and acceleration drills help late-race speed.
-
-### Plan Execution:
-- Speed sessions: 200-400m reps at race pace.
-- Endurance sessions: 1000-1600m reps at threshold pace.
-- Race simulation: 800m at race pace + 400m at 90% effort.
-
-### Common Issues & Adjustments:
-- Struggling with finishing kick → Add sprint drills and strides.
-- Fatigue in middle of race → Increase threshold and aerobic workouts.
-- Inconsistent pacing → Practice even splits and negative splits.
-
-### AI Integration:
-- AI assesses pacing patterns and adjusts workouts to match race goals.
-
-## Chapter 13: 5K & 10K Training
-
-### Key Training Rules:
-- Threshold training (T-pace) should make up 10-15% of total weekly mileage.
-- Long runs (E-pace) build aerobic endurance for race day.
-- Intervals (I-pace) improve speed and race pace efficiency.
-
-### Plan Execution:
-- Long runs: 75-90 minutes at easy pace.
-- Threshold sessions: 3-4 x 10 minutes at T-pace.
-- Interval workouts: 5-6 x 1000m at 5K pace.
-
-### Common Issues & Adjustments:
-- Struggling in second half of race → Increase tempo run volume.
-- Inconsistent pacing → Use race-pace workouts.
-- Lack of speed in final kick → Incorporate strides and short sprints.
-
-### AI Integration:
-- AI analyzes race splits and adjusts threshold vs. interval balance.
-
-## Chapter 14: Cross-Country Training
-
-### Key Training Rules:
-- Hill training builds strength and efficiency.
-- Threshold and interval training develop aerobic power.
-- Race simulation workouts prepare for surges and varying terrain.
-
-### Plan Execution:
-- Hill repeats: 6-8 x 300m hills at 5K effort.
-- Tempo runs: 20-30 minutes at threshold pace.
-- Race simulation: Fartlek workouts with surges.
-
-### Common Issues & Adjustments:
-- Struggling on hills → Increase strength and plyometrics.
-- Fatigue in final mile → Improve endurance with tempo work.
-- Pacing too aggressive early → Practice controlled starts in workouts.
-
-### AI Integration:
-- AI analyzes terrain difficulty and adjusts pacing recommendations.
-
-## Chapter 15: 15K to 30K Training
-
-### Key Training Rules:
-- These races require a balance of endurance and speed.
-- Long runs should be 90-120 minutes, at 60-75% of race pace.
-- Threshold training (T-pace) should make up 10-15% of total weekly mileage.
-- Marathon-pace running (M-pace) helps with sustained effort tolerance.
-- Intervals (I-pace) 5K-10K pace are included to maintain turnover and aerobic capacity.
-
-### Plan Execution:
-- Peak weekly mileage should be 1.5-2.5x race distance.
-- Back-to-back quality days can help simulate fatigue resistance.
-- Fueling must be practiced during long runs to prepare for extended race efforts.
-
-### Common Issues & Adjustments:
-- Hitting the wall too soon → Increase long runs gradually.
-- Struggling with pace changes → Incorporate progressive runs.
-- Poor endurance late in race → Add more M-pace training.
-
-### AI Integration:
-- AI monitors fatigue trends and adjusts intensity accordingly.
-
-## Chapter 16: Marathon Training
-
-### Key Training Rules:
-- Longest run should be 2.5-3 hours, no need to exceed 22-23 miles.
-- Long runs = 25-30% of weekly mileage, not more.
-- Peak mileage should be 2.5-3x race distance.
-- Tapering begins 3 weeks before race day; reduce mileage but keep intensity.
-
-### Plan Execution:
-- Mid-week medium-long run (~75% of long run) for endurance.
-- M-Pace (Marathon pace) workouts should be at 80-90% of race pace effort.
-- Threshold runs (T-Pace) should be 15-20 min per session.
-- Fueling practice is mandatory to avoid glycogen depletion.
-
-### Common Issues & Adjustments:
-- Bonking at 20 miles → More race-day fueling practice.
-- Inconsistent pacing → Practice race simulation workouts.
-- Fatigue in last few weeks → Ensure proper tapering and recovery.
-
-### AI Integration:
-- AI adjusts training loads based on fatigue, fueling, and pacing data.
-
-## Chapter 17: Ultra-Distance Training
-
-### Key Training Rules:
-- Back-to-back long runs (e.g., 4-hour run followed by 2-hour run the next day) help with fatigue adaptation.
-- Hiking should be incorporated into training for steep ultra races.
-- Race-day fueling strategy must be tested rigorously.
-
-### Plan Execution:
-- Longest run should be time-based, not distance-based.
-- Train on terrain similar to race conditions.
-- Mental toughness training (e.g., night runs, solo runs) prepares for race day challenges.
-
-### Common Issues & Adjustments:
-- Muscle fatigue too soon → Strength training and downhill running practice.
-- Digestive issues during race → Adjust fueling and hydration plans.
-- Mental burnout → Reduce intensity and vary terrain to keep training engaging.
-
-### AI Integration:
-- AI suggests fueling strategies and pacing adjustments based on race simulation data.
-
-## Chapter 18: Triathlon Training
-
-### Key Training Rules:
-- Balance training load across all disciplines (swimming, cycling, running).
-- Brick workouts (bike-to-run transitions) simulate race-day fatigue.
-- Bike endurance translates to run endurance; focus on bike fitness.
-- Run training should prioritize efficiency, not excessive volume.
-
-### Plan Execution:
-- Run 3-5x per week with a mix of easy runs, intervals, and race-pace workouts.
-- Long ride once per week, integrating race-pace efforts.
-- Swim at least 2-3x per week for technique and endurance.
-- Strength training 1-2x per week for injury prevention.
-
-### Common Issues & Adjustments:
-- Slow run off the bike → Increase brick training.
-- Fatigue from too much training → Adjust periodization to allow more recovery.
-- Struggling with swim efficiency → Increase form drills and technique sessions.
-
-### AI Integration:
-- AI adjusts swim, bike, and run volumes based on fatigue and performance data.
-
-## Final Takeaway:
-- Success in running requires structured periodization, targeted training zones, and individualization.
-- AI coaching dynamically adjusts workouts, recovery, and race strategies.
-- Use specific VDOT-based metrics to ensure optimal performance and injury prevention.
-
-</BOOK>
-
-
-<BOOK name="Roar" authors="Stacey Sims">
-
-# Key Principles and Main Takeaways from Stacey Sims' Nutrition & Strength Guidance
-
-This document provides evidence-based nutrition and strength training guidance tailored specifically for female athletes, considering hormonal fluctuations and physiological differences from male athletes.
-
----
-
-## Core Principles for Female Athletes
-
-1. **Women are not small men**
-   Training, nutrition, and recovery strategies must be adapted to female physiology, considering menstrual cycle phases, metabolism, and hormonal responses.
-
-2. **Nutrition should be periodized with training**
-   Macronutrient intake should align with energy demands, recovery needs, and hormonal fluctuations.
-
-3. **Recovery is time-sensitive**
-   Refueling within 30 minutes post-training with protein and carbohydrates optimizes muscle repair and adaptation.
-
-4. **Strength training is essential**
-   Women need targeted strength workouts to support performance, bone health, and injury prevention.
-
-5. **Hydration strategies should be adjusted**
-   Women sweat differently and lose more sodium than men, requiring tailored hydration strategies.
-
-6. **Avoid under-fueling (RED-S risk)**
-   Relative Energy Deficiency in Sport (RED-S) negatively impacts performance, immunity, bone density, and mental health.
-
-7. **Sleep and stress management matter**
-   Poor sleep and chronic stress increase cortisol levels, impair recovery, and hinder progress.
-
----
-
-## Female-Specific Nutrition Guidelines for Female Athletes
-
-### 1. Pre-Training Nutrition
-- **30–60 minutes before training:** Small meal/snack with:
-  - **Protein:** 10–15g
-  - **Carbohydrates:** 20–30g
-- **Avoid:** Fructose-based foods (e.g., apples, high-fiber foods) to prevent GI distress.
-
-**Examples:**
-- Low-fat yogurt with berries
-- Nut butter on whole grain toast
-- Protein smoothie with banana and almond milk
-
-### 2. During Training (for sessions > 60 min)
-- **Carbohydrates:** 30–40g per hour (salted potatoes, pretzels, or energy chews)
-- **Hydration:** 6–6.5 mL/kg/hour of functional hydration beverage
-
-### 3. Post-Training Recovery (within 30 minutes)
-- **Protein:** 25–30g
-- **Fast-digesting carbs** to promote muscle synthesis and glycogen replenishment
-- **Low-fat protein** preferred for faster gastric emptying
-
-**Examples:**
-- Protein shake with banana and almond milk
-- Turkey and cheese sandwich
-- Chocolate milk with almonds
-
-### 4. Daily Meal Planning
-
-#### A. Macronutrient Distribution
-- **Protein:** 1.6–2.2g/kg body weight daily
-- **Carbohydrates:** Adjust based on training load
-- **Healthy Fats:** Omega-3s from fish, nuts, seeds, and olive oil
-
-#### Body Type Descriptions
-
-| Body Type   | Description                                                                                                                                 |
-|-------------|---------------------------------------------------------------------------------------------------------------------------------------------|
-| Ectomorph   | Skinny build with high metabolism; requires more calories, carbs, and frequent meals to avoid being underweight and fuel performance.       |
-| Mesomorph   | Muscular, athletic build; benefits from balanced macros with adequate protein for muscle maintenance and carbs based on training intensity. |
-| Endomorph   | Rounded build that gains fat easily; needs higher protein, fewer carbs, and strict portion control to prevent unwanted weight gain.         |
-
-#### Meal Plans by Body Type
-
-##### Ectomorph Meal Plan
-
-| Time          | Meal                                                                                                                                                                 |
-|---------------|----------------------------------------------------------------------------------------------------------------------------------------------------------------------|
-| 6:00 AM       | Coffee + 6 oz vanilla almond milk with 15g protein powder OR 1 piece sprouted whole grain toast with 1 Tbsp almond butter                                           |
-| 6:30-7:45 AM  | Power Training: Running hill repeats followed by plyometrics                                                                                                         |
-| 8:00 AM       | Coffee/green tea + Quinoa Bowl OR 2 pieces sprouted whole grain toast with 2 Tbsp almond butter + Green Goddess Smoothie                                            |
-| 10:30 AM      | 1 piece fresh fruit with ¼ cup mixed nuts and 4 oz low-fat Greek yogurt                                                                                              |
-| 12:30 PM      | Sandwich with hummus, veggies, ½ cup quinoa/barley with 4 oz protein + fruit OR Mixed green salad with fish/chicken, veggies, nuts, and ½ cup quinoa                |
-| 3:30 PM       | Tea/coffee + veggie sticks with hummus OR Greek yogurt with berries and almonds OR sprouted grain toast with nut butter                                              |
-| 5:30 PM       | 15 veggie sticks with 2-3 Tbsp hummus                                                                                                                                |
-| 7:30 PM       | Seafood curry with rice/quinoa OR 6 oz salmon/bison with vegetables and salad OR Stir-fry with lean protein and colorful salad                                       |
-| 8:30 PM       | 20g casein protein with 4 oz tart cherry juice                                                                                                                       |
-
-##### Mesomorph Meal Plan
-
-| Time          | Meal                                                                                                                                                                 |
-|---------------|----------------------------------------------------------------------------------------------------------------------------------------------------------------------|
-| 6:00 AM       | Coffee + 6 oz unsweetened vanilla almond milk with 15g protein                                                                                                       |
-| 6:30-7:45 AM  | CrossFit or endurance tempo training with hydration                                                                                                                  |
-| 8:00 AM       | Coffee + 3 egg whites with yolk, avocado, corn tortillas, cheese, salsa OR Potato/vegetable sauté with 4 oz lean protein                                             |
-| 10:30 AM      | 2 hard-cooked eggs with 1 piece fresh fruit + ¼ cup mixed nuts                                                                                                        |
-| 12:30 PM      | Salad with 4 oz fish/protein over greens OR 6-8 sushi rolls with avocado and miso soup OR Quinoa tortilla with hummus, protein, veggies + fruit OR Chicken with sweet potato and salad |
-| 3:30 PM       | Tea/coffee + nut butter protein spread with banana                                                                                                                   |
-| 5:30 PM       | 1-2 Vegan Nut Butter Balls                                                                                                                                           |
-| 7:30 PM       | Stir-fry vegetables over brown rice with protein salad OR Quinoa/Broccoli/Apple salad OR Warm Potato Salad with lean protein                                         |
-| 8:30 PM       | 20g casein protein with 4 oz tart cherry juice                                                                                                                       |
-
-##### Endomorph Meal Plan
-
-| Time          | Meal                                                                                                                                                                 |
-|---------------|----------------------------------------------------------------------------------------------------------------------------------------------------------------------|
-| 6:00 AM       | Coffee + ½ banana/apple with Greek yogurt OR almond milk with protein powder                                                                                         |
-| 6:30 AM       | HIIT Session: 10-15min warmup + 200m sprints, bodyweight exercises, cooldown                                                                                         |
-| Post-workout  | Greek yogurt with almonds and apple OR Toast with cheese, tomato, avocado OR Full breakfast                                                                          |
-| Breakfast     | Poached eggs with spinach on toast OR Overnight oats with nuts, berries, yogurt OR Green Goddess Smoothie OR Protein pancakes with berries                           |
-| 11:30 AM      | 2 hard-cooked eggs with 1 piece fresh fruit                                                                                                                          |
-| 1:30 PM       | Whole wheat pita with hummus, veggies, cottage cheese/tuna + fruit OR Salad with grilled chicken, nuts, berries OR Corn tortilla with nut butter, yogurt, strawberries |
-| 4:30 PM       | Tea/coffee + apple with cheese OR Turkey slices with strawberries OR Edamame with Brazil nuts                                                                        |
-| 6:30 PM       | 4-6 oz lean protein with steamed vegetables and mixed salad OR Stir-fry vegetables with lean protein over rice/quinoa and salad                                      |
-| 8:30 PM       | 20g casein protein with 4 oz tart cherry juice                                                                                                                       |
-
-#### Meal Plans by Training Session Schedule
-
-##### Morning Training Session Meal Plan
-
-| Time               | Meal                                                                                                                                   |
-|--------------------|----------------------------------------------------------------------------------------------------------------------------------------|
-| 7:00 AM Wake up    | -                                                                                                                                      |
-| 7:30 AM Breakfast  | Quinoa Bowl OR Green Goddess Smoothie with 2 pieces sprouted grain toast with nut butter OR Protein pancakes                          |
-| 9:00-11:00 AM Training | One 24-oz bottle functional hydration beverage during swim + 4 oz protein recovery drink between swim and run                     |
-| 11:30 AM Recovery  | 1½ scoops pea protein isolate (30g) with 6 oz almond milk, 6 oz water, and 1 Tbsp nut butter                                          |
-| 1:00 PM Lunch      | 2 slices sprouted grain bread with hummus, vegetables, and ½ cup quinoa/barley + 1 piece fresh fruit OR 4 oz meat substitute in mixed green salad with varied vegetables |
-| 3:00 PM Snack      | Protein Peanut Butter Banana (nut butter mixed with protein powder) OR 1 piece sprouted grain toast with Toasted Almond Spread        |
-| 5:00 PM Dinner     | 2 cups stir-fry vegetables over 1-1½ cups quinoa with side salad OR Quinoa, Broccoli, Apple, and Pomegranate Salad over mixed greens |
-
-##### Two-a-Day Training Meal Plan (Morning Strength + Afternoon Ride)
-
-| Time                | Meal                                                                                                                                          |
-|---------------------|-----------------------------------------------------------------------------------------------------------------------------------------------|
-| 6:30 AM Wake up     | Latte with low-fat milk or milk alternative                                                                                                  |
-| 7:00 AM Breakfast   | 2 poached eggs with spinach on sprouted grain toast OR ½ cup overnight oats with walnuts, blueberries, Greek yogurt OR Green Goddess Smoothie |
-| 8:30-10:00 AM Strength | Hydration only: 16 oz fluid with 5g BCAAs                                                                                                 |
-| 10:30 AM Post-strength | 10 almonds in ½ cup cottage cheese with cinnamon OR 1 apple with 1 oz cheese                                                              |
-| 12:30 PM Lunch      | 6-8 sushi rolls with avocado and miso soup OR Quinoa tortilla with hummus, veggies, protein + fruit OR Bagel with lox, cream cheese, vegetables OR Grilled chicken with sweet potato and salad |
-| 4:30-6:00 PM Training Ride | Hydration: 0.10-0.12 oz per lb per hour + 1.3-1.6 food calories per lb per hour (nut butter sandwich, date brownie, small potatoes, Salty Balls) |
-| 6:30 PM Recovery    | 16-oz smoothie with frozen banana, milk, protein powder, and yogurt                                                                          |
-| 8:00 PM Dinner      | Seafood curry with vegetables over rice OR Steamed vegetables with 6 oz protein and mixed salad OR Broth-based soup with lean protein, broccoli, and spinach salad |
-
-##### Endurance Event Fueling Guide
-
-| Timing             | Good                                                                              | Okay                                                                  | Not Good                                              |
-|--------------------|-----------------------------------------------------------------------------------|-----------------------------------------------------------------------|-------------------------------------------------------|
-| Night Before Event | Waffles, pasta, whole grain bread, oatmeal, quinoa, fish, poultry, light salad    | Regular dinner foods you normally eat                                 | High-fat/high-protein meals, fructose-based foods     |
-| 1-3 Hours Before   | Bananas, grapes, oranges, berries, toast with nut butter                          | Sandwich, PB&J, lean protein wrap with minimal veggies                | Apples, grapefruit, high-fiber foods                  |
-| 0-1 Hour Before    | 10-15g protein (30 min before), fat-free yogurt, almond butter sandwich on low-fiber bread | Low-fiber toast with jam, English muffin with spread, small handful of nuts with banana | Fructose-based foods, high-fat or high-protein items |
-| During Exercise    | 30-40g carbs/hour (for 60+ min sessions), salted potatoes, sandwich bites, low-fat muffin, jelly beans | Uncoated protein bars (190-210 calories), exercise-specific chews/blocks, trail mix | Fruit-based bars, 5-8% carb drinks, gels and GUs     |
-| After/Recovery     | 25-30g protein within 30 min, carbs within 2 hours, PB&J, lean protein with starchy veggies, smoothie with protein | Veggie wraps with protein, small bean burritos, low-fat mocha with bagel | Processed sugars, candy (except protein powder is okay) |
-
-#### Nutrient Content Charts
-
-##### Carbohydrate Content (g) in Typical Servings
-
-| Food Category           | Food Item                                    | Carbohydrates (g) |
-|-------------------------|----------------------------------------------|-------------------|
-| **Bread & Baked Goods** | ½ whole grain bagel                          | 34                |
-|                         | 2 whole grain pancakes                        | 32                |
-|                         | 1 multigrain English muffin                   | 27                |
-|                         | ½ fruit muffin                                | 23                |
-|                         | 1 small whole wheat pita                      | 16                |
-|                         | 1 slice sprouted grain bread                  | 15                |
-|                         | 1 cup pasta                                   | 35                |
-|                         | 1 cup brown rice                              | 45                |
-| **Breakfast Cereals**   | ⅔ cup cooked black rice                      | 34                |
-|                         | 1 cup cooked quinoa                           | 29                |
-|                         | 1 cup cooked oatmeal                          | 27                |
-|                         | ¾ cup Nature's Path Organic Flax Plus cereal  | 23                |
-| **Vegetables**          | 1 cup broccoli                                | 6                 |
-|                         | 1 cup potatoes                                | 26                |
-|                         | 1 cup beets                                   | 13                |
-|                         | 1 cup carrots                                 | 12                |
-|                         | 1 cup corn                                    | 25                |
-|                         | 1 cup yams                                    | 35                |
-| **Fruits**              | 1 small box raisins (1.5 oz)                  | 34                |
-|                         | 3 medium dates, fresh                         | 31                |
-|                         | 1 large apple                                 | 30                |
-|                         | 1 medium banana                               | 27                |
-|                         | 1 medium grapefruit                           | 26                |
-|                         | 1 medium pear                                 | 25                |
-|                         | 1 large fresh fig                             | 24                |
-|                         | 2 kiwifruit                                   | 24                |
-|                         | 1 cup raw cherries                            | 22                |
-|                         | 1 cup fresh blueberries                       | 21                |
-|                         | 1 medium orange                               | 18                |
-|                         | 2 thick pineapple slices                      | 16                |
-|                         | 1 cup fresh strawberry halves                 | 12                |
-|                         | 1 medium peach                                | 11                |
-|                         | 2 large apricots, fresh                       | 7                 |
-| **Dairy & Alternatives**| 1 cup fat-free milk                           | 12                |
-|                         | 1 cup low-fat plain kefir                     | 12                |
-|                         | 1 cup almond-cashew-hazelnut milk             | 2                 |
-|                         | 1 cup unsweetened almond milk                 | 1                 |
-|                         | 1 cup Greek yogurt                            | 9                 |
-| **Other**               | 1 Tbsp jam, honey, or maple syrup             | 17                |
-|                         | ¼ cup chocolate chips                         | 10                |
-|                         | ¼ cup broad beans (fava beans)                | 26                |
-|                         | ½ cup chickpeas, kidney beans, or black beans | 21                |
-|                         | ½ cup edamame, shelled                        | 10                |
-
-##### Protein Content (g) in Typical Servings
-
-| Food Category        | Food Item                                      | Protein (g) |
-|----------------------|------------------------------------------------|-------------|
-| **Lean Meat**        | 3 oz chicken                                   | 31          |
-|                      | 3 oz lean rump steak                           | 26          |
-|                      | 3 oz lean sirloin steak                        | 26          |
-|                      | 3 oz lean bison                                | 24          |
-|                      | 4 oz lamb chops                                | 23          |
-| **Eggs**             | 2 large eggs                                   | 12          |
-|                      | 3 egg whites                                   | 11          |
-| **Fish**             | 3 oz salmon                                    | 22          |
-|                      | 3 oz tuna, canned in water                     | 22          |
-|                      | 3 oz fresh cod                                 | 20          |
-|                      | 3 oz cooked blue mussels                       | 20          |
-|                      | 4 colossal shrimp                              | 18          |
-|                      | 6 oysters, raw                                 | 5           |
-| **Dairy Products**   | 1 cup (8 oz) fat-free Greek yogurt             | 23          |
-|                      | ½ cup fat-free cottage cheese                  | 15          |
-|                      | 1 cup (8 oz) low-fat plain kefir               | 11          |
-|                      | 8 oz fat-free milk                             | 9           |
-| **Beans & Lentils**  | 1 cup lentils                                  | 18          |
-|                      | 1 cup shelled edamame                          | 18          |
-|                      | ½ cup chickpeas or black beans                 | 7           |
-| **Nuts & Seeds***    | 24 raw almonds                                 | 6           |
-|                      | 3 Tbsp sunflower seeds                         | 6           |
-|                      | 1 oz raw cashews, hazelnuts, or Brazil nuts    | 5           |
-|                      | ¼ cup raw walnuts                              | 5           |
-|                      | 1 Tbsp pumpkin seeds (high leucine)            | 3           |
-| **Grains**           | ½ cup uncooked amaranth                        | 14          |
-|                      | ½ cup uncooked kamut                           | 14          |
-|                      | ½ cup uncooked hulled barley                   | 12          |
-|                      | ½ cup uncooked quinoa                          | 12          |
-
-
-#### ROAR Sample Recipes
-
-##### Energy & Recovery Snack Recipes
-
-| Recipe | Ingredients | Instructions |
-|--------|-------------|--------------|
-| **Homemade Bar** | ¾ cup brown rice syrup<br>⅔ cup natural nut butter<br>1½-2 cups crisped rice cereal<br>1-2 crushed vanilla beans (optional)<br>¼ cup raisins (optional)<br>⅓ cup crushed pretzels (optional)<br>Dash of sea salt | Microwave brown rice syrup for 1 min 20 sec until bubbling. Stir in nut butter until combined. Add cereal and optional ingredients. Press into 8"×8" pan, sprinkle with salt. Chill 30-45 min until firm. Cut into 2"×2" bars. |
-| **Salty Balls** | ½ cup natural chunky nut butter<br>½ cup brown rice syrup<br>½ cup vanilla protein powder<br>¼ tsp cinnamon<br>1 tsp espresso powder (optional)<br>2 Tbsp cocoa powder/coconut/almond meal<br>Dash of sea salt | Combine nut butter and syrup in bowl, microwave 1 minute. Stir, add protein powder, cinnamon, and espresso powder. Roll into 1" balls. Coat with cocoa or coconut/almond meal, sprinkle with salt. Store in fridge up to 2 weeks. |
-| **Quinoa Bowl** | 1 cup almond milk<br>1 cup water<br>1 cup quinoa<br>2 cups blackberries<br>½ tsp cinnamon<br>⅓ cup toasted pecans<br>4 tsp maple syrup | Combine milk, water, quinoa in saucepan. Bring to boil, reduce heat, simmer covered 15 min. Let stand 5 min. Stir in blackberries and cinnamon. Top with pecans and maple syrup. |
-| **Green Goddess Smoothie** | 1 cup cold almond milk<br>⅔ cup frozen mango<br>1 banana<br>3 leaves kale (½ cup packed)<br>2 Tbsp flaked coconut<br>1 tsp flaxseeds | Blend all ingredients until smooth. |
-| **Date Brownie** | 5 Medjool dates, pitted<br>⅔ cup toasted hazelnuts<br>Juice & zest of 1 orange<br>½ cup dark cocoa powder<br>Pinch of salt | Blend dates to puree in food processor. Add remaining ingredients. If too dry, add more orange juice. Press into 8"×8" pan, refrigerate 1+ hour before cutting. |
-
-##### For constructing meals
-
-| Recipe | Ingredients | Instructions |
-|--------|-------------|--------------|
-| **Toasted Almond Spread** | 3½ cups raw almonds<br>½ Tbsp coconut oil<br>1 tsp cinnamon<br>1 Tbsp honey<br>½ tsp salt flakes | Preheat oven to 350°F. Toast almonds 8-10 min until golden. Blend while warm (about 10 min) until liquid. Add remaining ingredients, blend thoroughly. Store in refrigerator up to 2 weeks. |
-| **Oatmeal with Blueberries** | 2 cups water<br>½ tsp cinnamon<br>¼ tsp ginger<br>3 Tbsp each: sunflower & chia seeds<br>2⅓ cups gluten-free oatmeal<br>¼ tsp salt<br>20g protein powder<br>1 cup blueberries<br>Honey to taste | Boil water with spices and seeds. Add oatmeal, simmer to desired consistency. Remove from heat, stir in salt and protein powder. Serve with blueberries and honey. |
-| **Quinoa, Broccoli, Apple & Pomegranate Salad** | 1 head broccoli<br>2 Tbsp olive oil<br>2 apples<br>1 lime (juice & zest)<br>1 pomegranate<br>3 cups cooked quinoa<br>⅓ cup Lime Vinaigrette | Separate broccoli into florets, pan-roast in oil until browned. Cube apples, toss with lime juice/zest. Extract pomegranate seeds. Toss quinoa with broccoli, apples and dressing. Top with pomegranate seeds. |
-| **Lime Vinaigrette** | 3 Tbsp lime juice<br>Zest of 2 limes<br>3 Tbsp honey<br>1 tsp wasabi<br>½ tsp tamari<br>⅔ cup olive oil | Whisk together all ingredients except oil. Slowly add oil while whisking until emulsified. Season to taste. |
-| **Caramelized Cauliflower Salad** | 1 head cauliflower<br>3 Tbsp olive oil<br>⅔ cup raw almonds<br>3 cups mixed lettuce<br>3 Tbsp goji berries<br>4 Tbsp cider vinaigrette | Pan-roast cauliflower in oil until caramelized (20 min). Toast almonds 7-8 min. Toss cauliflower with almonds, lettuce, goji berries, and vinaigrette. |
-| **Vegan Nut Butter Balls** | ½ cup nut butter<br>¼ cup oats<br>⅓ cup protein powder<br>¼ cup coconut<br>½ tsp cinnamon<br>¼ cup apple cider<br>1 Tbsp maple syrup<br>⅓ cup rice cereal (optional) | Mix all ingredients except rice cereal until combined. Gently fold in cereal if using. Shape into 16 balls (1" diameter). Refrigerate up to 3 weeks. |
-| **Warm Potato Salad** | 1 lb new potatoes<br>2 Tbsp coconut oil<br>1 head broccoli<br>3 Tbsp dried cranberries<br>Lemon zest<br>¼ cup Orange Vinaigrette | Pan-roast potato pieces in coconut oil. Separately pan-roast broccoli florets. Combine with cranberries, lemon zest, and toss with dressing. |
-| **Orange Vinaigrette** | ¼ cup orange juice<br>Zest of 2 lemons<br>3 Tbsp Dijon mustard<br>2 Tbsp cider vinegar<br>1 Tbsp honey<br>½ tsp salt<br>⅔ cup olive oil<br>Black pepper | Whisk together all ingredients except oil. Slowly add oil while whisking until emulsified. Season to taste. |
-
----
-
-## Strength Training for Female Runners
-
-### 1. Key Strength Workouts
-- Strength training builds power, endurance, and injury resilience.
-
-### 2. Cycle-Specific Strength Adaptations
-- **Follicular phase (Day 1–14):**
-  - Higher estrogen → better muscle adaptation
-  - Focus on heavier strength work
-
-- **Luteal phase (Day 15–28):**
-  - Progesterone rises → higher core temp, lower recovery
-  - Shift to bodyweight + mobility work
-
----
-
-## How to Apply These Principles to an AI-Powered Running & Nutrition Coach
-
-1. **Personalized Nutrition Plans**
-   - Adjust macros based on training cycle, menstrual phase, body type, and recovery needs
-   - Automated meal suggestions tailored to an athlete’s needs and preferences
-
-2. **Dynamic Strength and Running Plans**
-   - Adapt training intensity based on hormonal cycle
-   - AI-driven modifications if fatigue, injury, or poor recovery are reported
-
-3. **Injury Prevention Alerts**
-   - Track hydration, nutrition, and training loads to predict overtraining risk
-   - Offer proactive recovery strategies based on biofeedback data
-
-4. **Smart Recovery Insights**
-   - Prompt athletes to refuel within 30 minutes post-workout
-   - Provide sleep tracking recommendations to optimize hormone balance
-
----
-
-## Key Takeaways for Female Athletes
-
-- **Fuel early and often:** Pre-workout carbs and protein boost performance
-- **Train with your cycle:** Adjust workouts to optimize strength gains and recovery
-- **Prioritize protein post-workout:** Aim for 25–30g within 30 minutes
-- **Stay hydrated smartly:** Women need more sodium than men
-- **Strength training is non-negotiable:** It prevents injuries and boosts endurance
-- **Avoid under-fueling:** Low energy availability leads to performance loss and health risks
-
-</BOOK>
-
-<TABLE name = "Exercises for Different Body Regions and Conditions">
-
-Use these sample exercises in muscle activation, mobility, strength routines, or run workouts to target different body regions
-or conditions personalized to the user:
----
-| **Region / Condition**       | **Exercise**                                     | **Prescription**                          | **Description**                                                                                                 |
-|------------------------------|--------------------------------------------------|--------------------------------------------|----------------------------------------------------------------------------------------------------------------|
-| **Feet & Toes**              | Toe Yoga                                         | 10 reps, 3x daily                          | Alternately lift and lower individual toes while keeping others pressed down; focus on control and isolation.    |
-|                              | Balance Work                                     | 30s single-leg holds, 3x per leg           | Stand on one foot with knee slightly bent, maintain steady position without touching other foot down.           |
-|                              | Arch Activation (Short Foot)                     | 10 reps per foot                           | While seated, shorten foot by drawing ball of foot toward heel without curling toes; hold 5 seconds.            |
-|                              | Foot Rolling                                     | 2 min each foot                            | Roll tennis ball or massage ball under arch and ball of foot, applying moderate pressure to tight areas.         |
-|                              | Toe Stretch & Big Toe Extension                  | 10 reps, 3x per day                        | Gently pull toes back toward shin, then focus on lifting just the big toe while keeping others down.            |
-|                              | Calf Stretch & Eccentric Heel Drops              | 3x15 reps, slow lowering                   | Stand on edge of step, raise up on toes then slowly lower heels below step level over 3-5 seconds.              |
-| **Ankles**                   | Eccentric Calf Raises                            | 3x15 reps, slow lowering                   | Rise onto balls of feet quickly, then lower heels toward ground slowly over 3-5 seconds.                        |
-|                              | Balance Training (Eyes closed)                   | 20s single-leg hold                         | Stand on one leg with eyes closed, maintain position without touching other foot down.                          |
-|                              | Ankle Mobility Drills                            | 2–3 min per session                        | Push knee forward over toe while keeping heel down; perform in multiple directions.                             |
-|                              | Single-Leg Balance Work                          | 30s per leg, 3x per day                    | Stand on one leg while performing small controlled movements with arms or free leg.                             |
-| **Shins (Shin Splints)**     | Heel Walks                                       | 30s x 3 rounds                             | Walk on heels with toes lifted off ground, activating anterior shin muscles.                                    |
-|                              | Eccentric Calf Raises                            | 3x15 reps                                  | Rise onto balls of feet quickly, then lower heels toward ground slowly over 3-5 seconds.                        |
-|                              | Foam Rolling (Calves)                            | 2 min per leg                              | Roll foam roller under calf muscles, pausing on tender spots for 20-30 seconds.                                |
-| **Achilles Tendon**          | Eccentric Calf Raises                            | 3x15 reps per leg                          | Rise onto ball of foot, then slowly lower heel below step level over 3-5 seconds; perform on one leg at a time. |
-|                              | Ankle Mobility Drills                            | 2–3 min per session                        | Push knee forward over toe while keeping heel down; perform in multiple directions.                             |
-|                              | Single-Leg Balance Work                          | 30s per leg, 3x per day                    | Stand on one leg while performing small controlled movements with arms or free leg.                             |
-| **Plantar Fasciitis**        | Foot Rolling                                     | 2 min each foot                            | Roll tennis ball or massage ball under arch and ball of foot, applying moderate pressure to tight areas.         |
-|                              | Toe Stretch & Big Toe Extension                  | 10 reps, 3x per day                        | Gently pull toes back toward shin, then focus on lifting just the big toe while keeping others down.            |
-|                              | Calf Stretch & Eccentric Heel Drops              | 3x15 reps, slow lowering                   | Stand on edge of step, raise up on toes then slowly lower heels below step level over 3-5 seconds.              |
-| **Knees**                    | Monster Walks (Lateral Band Walks)               | 3x15 steps each way                        | Place resistance band above knees, take wide steps sideways while maintaining tension in the band.              |
-|                              | Eccentric Squats                                 | 3x8–10 reps                                | Lower into squat position slowly over 3-5 seconds, rise up at normal speed; focus on proper knee alignment.     |
-| **Hips**                     | Hip Floss & 3D Pivots                            | 3x each direction                          | Move hip through full range of motion in circular patterns while maintaining stability in standing leg.         |
-|                              | Single-Leg Romanian Deadlifts                    | 3x8 reps per leg                           | Balance on one leg, hinge at hips while extending free leg behind you until torso is parallel to floor.         |
-|                              | Lateral Band Walks                               | 3x15 steps each way                        | Place resistance band above knees or ankles, step sideways while maintaining band tension and proper posture.   |
-|                              | Hip Hikes                                        | 3x10 per side                              | Standing on one leg, drop and then raise opposite hip without leaning or compensating with upper body.          |
-| **Hamstrings**               | Nordic Hamstring Curls                           | 3x5 reps, slow lowering                    | Kneel with ankles secured, lower torso toward ground using hamstrings to control descent.                       |
-|                              | Single-Leg Deadlifts                             | 3x8 per leg                                | Balance on one leg, hinge at hips while extending free leg behind you until torso is parallel to floor.         |
-|                              | Glute Bridges                                    | 3x15 reps                                  | Lie on back with knees bent, lift hips toward ceiling until body forms straight line from shoulders to knees.   |
-| **Muscle & Bone Healing**    | Isometric Holds                                  | 30s x 3 sets                               | Contract muscle without movement, holding at approximately 70% effort without pain.                             |
-|                              | Eccentric Loading                                | 3–4 sets of 8–10 reps                      | Perform slow lowering phase (3-5 seconds) of exercise specific to injured area.                                 |
-|                              | Progressive Weight-Bearing Activities            | Based on recovery stage                    | Gradually increase weight-bearing on injured area as tolerated, following healthcare provider guidance.          |
-|                              | Plyometrics                                      | 2x per week (post-clearance)               | Perform jumping or explosive movements only after medical clearance, starting with low intensity.                |
-| **Soft Tissue & Recovery**   | Foam Rolling                                     | 30–60 sec per muscle group                 | Roll body weight over foam roller, moving slowly and pausing on tender areas.                                   |
-|                              | Massage Guns                                     | 2–3 min per muscle group                   | Apply percussive massage device to muscles using light to moderate pressure, avoiding bony areas.               |
-|                              | Lacrosse Ball Self-Massage                       | 1 min per tight spot                       | Place ball under tight muscle, apply bodyweight and make small movements to release tension.                    |
-|                              | Compression Boots                                | 15–30 min post-workout                     | Use pneumatic compression boots on legs to enhance circulation and reduce inflammation.                         |
-| **IT Band Syndrome**         | Lateral Band Walks                               | 3x15 steps each way                        | Place resistance band above knees or ankles, step sideways while maintaining tension in the band.               |
-|                              | Hip Hikes                                        | 3x10 per side                              | Standing on one leg, drop and then raise opposite hip without leaning or compensating with upper body.          |
-|                              | Foam Rolling IT Band & Quads                     | 2 min per leg                              | Roll outer thigh and front of thigh slowly, pausing on tender spots for 20-30 seconds.                         |
-| **Low Back / Core**          | All-Four Belly Lift                              | 5 breaths, 3x per session                  | On hands and knees, draw navel toward spine while maintaining neutral position, breathe deeply.                  |
-|                              | Plank with Hip Drivers                           | 3x30s each direction                       | Hold plank position, rotate one hip toward floor then drive it upward, alternating sides.                       |
-|                              | Thoracic Mobility Work                           | 3–5 min daily                              | Perform gentle rotations, extensions, and side bends focused on the mid-back region.                            |
-| **Running Form Drills**      | A & B Skips                                      | 3x20m                                      | A-skip: High knee lift with arm drive; B-skip: Add leg extension after knee lift before ground contact.         |
-|                              | High Knees                                       | 3x20m                                      | Run in place lifting knees to hip height with rapid turnover, maintain upright posture.                         |
-|                              | Stride Outs                                      | 4x50m at 85% effort                        | Gradually accelerate to near-sprint speed focusing on form, arm drive, and relaxed upper body.                  |
-
-
-</TABLE>
-
-<TABLE name = "Strength Training Exercises">
-Follow these rules for constructing a strength program:
-Strength Plan Overview
-
-| Category             | Guidance                                                  |
-|----------------------|-----------------------------------------------------------|
-| Total Exercises      | 5–7 per session, 1-3 compound movements and 2-3 accessory movements|
-| Core "Dessert"       | Add 2–3 core exercises at the end    |
-| Extras               | If more advanced, can mix in extra exercises from knowledge base|
-| Compound Movement Reps | Start with 3x12 → progress to 3x5–7 as weight increases |
-
----
-Compound Movements (Multi-Joint) - Choose 2-3 per session
-
-| Movement         | Notes                                      | Description                                                                                           | Suggested Weight Range                                                 |
-|------------------|--------------------------------------------|-------------------------------------------------------------------------------------------------------|-----------------------------------------------------------------------|
-| Squat            | Full-body lower-body dominant              | Stand with feet shoulder-width apart, lower hips back and down until thighs are parallel to floor, then drive through heels to stand. | Beginner: 5-15 lb dumbbells or bodyweight<br>Intermediate: 45-65 lb barbell<br>Advanced: 75-135+ lb barbell |
-| Deadlift         | Posterior chain focus                      | Stand with feet hip-width, hinge at hips with flat back, grip bar, push floor away through heels while keeping bar close to legs. | Beginner: 15-35 lb kettlebell/dumbbells<br>Intermediate: 65-95 lb barbell<br>Advanced: 115-185+ lb barbell |
-| Bench Press      | Upper-body push                            | Lie on bench, grip barbell wider than shoulders, lower bar to mid-chest, press back up with elbows tucked at 45° angle. | Beginner: 5-20 lb dumbbells or empty bar<br>Intermediate: 45-65 lb barbell<br>Advanced: 75-115+ lb barbell |
-| Pull Up          | Upper-body pull                            | Hang from bar with overhand grip, pull body up until chin clears bar by engaging back muscles, lower with control. | Beginner: Assisted with band/machine<br>Intermediate: Bodyweight 3-5 reps<br>Advanced: Bodyweight 8-12+ reps |
-| Overhead Press   | Shoulder + core engagement                 | Stand with barbell at shoulders, press directly overhead while keeping core tight, lower with control. | Beginner: 5-15 lb dumbbells<br>Intermediate: 30-45 lb barbell<br>Advanced: 55-75+ lb barbell |
-| Push Press       | Dynamic overhead movement                  | Start like overhead press, but use slight knee bend and explosive leg drive to help press weight overhead. | Beginner: 10-20 lb dumbbells<br>Intermediate: 40-55 lb barbell<br>Advanced: 65-85+ lb barbell |
-
----
-Accessory Movements – Gym Based - Choose 2-3 per session
-
-| Exercise                                 | Focus Area                          | Description                                                                                           | Suggested Weight Range                                                 |
-|------------------------------------------|--------------------------------------|-------------------------------------------------------------------------------------------------------|-----------------------------------------------------------------------|
-| RDL (Romanian Deadlift)                 | Hamstrings, glutes                   | Hold weight at thighs, hinge at hips with slight knee bend until weight reaches mid-shin, keeping back flat, then return to standing. | Beginner: 10-25 lb dumbbells<br>Intermediate: 45-75 lb barbell<br>Advanced: 85-135+ lb barbell |
-| Hip Thrust                              | Glutes, posterior chain              | Sit with upper back against bench, barbell across hips, feet flat, drive through heels to lift hips until body forms straight line. | Beginner: 0-45 lb barbell<br>Intermediate: 65-95 lb barbell<br>Advanced: 135-185+ lb barbell |
-| Hamstring Curl                          | Hamstrings                           | Using machine, lie face down and flex knees to bring heels toward glutes, then lower with control. | Beginner: 10-25 lb<br>Intermediate: 30-45 lb<br>Advanced: 50-70+ lb |
-| Lunges (all types)                      | Quads, glutes, balance               | Step forward (or backward/lateral), lower until both knees reach 90°, push through front heel to return to start. | Beginner: Bodyweight or 5-15 lb dumbbells<br>Intermediate: 20-30 lb dumbbells<br>Advanced: 35-50+ lb dumbbells |
-| Push Ups                                | Chest, arms, core                    | Start in plank position, lower chest to floor by bending elbows at 45° angle, push back up to straight arms. | Beginner: Modified on knees<br>Intermediate: Full body<br>Advanced: Elevated feet or weighted |
-| Farmers Carry                           | Grip strength, core, posture         | Hold heavy weights at sides, walk with upright posture and engaged core for distance or time. | Beginner: 15-25 lb dumbbells<br>Intermediate: 30-45 lb dumbbells<br>Advanced: 50-70+ lb dumbbells |
-| Bent Over Row (Dumbbell)                | Back, biceps                         | Hinge forward with flat back, pull dumbbells to ribcage while keeping elbows close to body, lower with control. | Beginner: 8-15 lb dumbbells<br>Intermediate: 20-30 lb dumbbells<br>Advanced: 35-50+ lb dumbbells |
-| Lateral Step Ups                        | Glutes, quads, single-leg strength   | Stand beside box/bench, step up sideways driving through heel, fully extend hip at top, lower with control. | Beginner: Bodyweight or 5-10 lb dumbbells<br>Intermediate: 15-25 lb dumbbells<br>Advanced: 30-40+ lb dumbbells |
-| Seated Overhead Press                   | Shoulders, triceps                   | Sit on bench with back support, press dumbbells from shoulder height directly overhead, lower with control. | Beginner: 5-12 lb dumbbells<br>Intermediate: 15-25 lb dumbbells<br>Advanced: 30-40+ lb dumbbells |
-| Skull Crushers                          | Triceps                              | Lie on bench, hold weight with straight arms above chest, bend elbows to lower weight toward forehead, extend arms. | Beginner: 5-15 lb EZ bar/dumbbells<br>Intermediate: 20-30 lb<br>Advanced: 35-45+ lb |
-| Dumbbell Pull Over                      | Chest, lats                          | Lie on bench holding dumbbell above chest with straight arms, lower weight in arc behind head, return to start. | Beginner: 8-15 lb dumbbell<br>Intermediate: 20-30 lb dumbbell<br>Advanced: 35-50+ lb dumbbell |
-| RFESS (Rear Foot Elevated Split Squat)  | Glutes, quads, balance               | Place rear foot on bench, front foot forward, lower until front thigh is parallel to floor, push through front heel to rise. | Beginner: Bodyweight or 5-10 lb dumbbells<br>Intermediate: 15-25 lb dumbbells<br>Advanced: 30-45+ lb dumbbells |
-| Nordic Hamstring Curls                  | Hamstrings                           | Kneel with ankles secured, lower torso toward floor using hamstrings to control descent, use hands to assist return. | Beginner: Assisted with hands/band<br>Intermediate: Less assistance<br>Advanced: Minimal/no assistance |
-| Step Ups                                | Quads, glutes                        | Stand facing box/bench, step up driving through heel, extend hip at top, lower with control. | Beginner: Bodyweight or 5-10 lb dumbbells<br>Intermediate: 15-25 lb dumbbells<br>Advanced: 30-40+ lb dumbbells |
-| Single Leg Hip Thrust                   | Glutes, hamstrings, unilateral focus | Set up as regular hip thrust but with one foot on ground and other leg extended, drive through heel to lift hips. | Beginner: Bodyweight<br>Intermediate: 10-25 lb plate/dumbbell<br>Advanced: 35-55+ lb plate/dumbbell |
-
----
-Core Exercises (Add 2–3 at End of Session)
-
-| Exercise         | Focus Area            | Description                                                                                           | Suggested Weight Range                                                 |
-|------------------|------------------------|-------------------------------------------------------------------------------------------------------|-----------------------------------------------------------------------|
-| Planks           | Core stability         | Hold push-up position on forearms with body in straight line from head to heels, engage core and glutes. | Beginner: 20-30s<br>Intermediate: 45-75s<br>Advanced: 90s+ or weighted |
-| V-Ups            | Lower & upper abs      | Lie on back, simultaneously lift straight legs and torso to touch fingers to toes, lower with control. | Beginner: Bent knees<br>Intermediate: Straight legs<br>Advanced: Weighted with 5-10 lb plate |
-| Leg Lifts        | Lower abs              | Lie on back with hands under lower back, lift straight legs to 90°, lower slowly without touching floor. | Beginner: Bent knees<br>Intermediate: Straight legs<br>Advanced: Add hold at bottom |
-| Seated Twists    | Obliques, rotation     | Sit with knees bent and heels on floor, lean back slightly, rotate torso side to side with control. | Beginner: Bodyweight<br>Intermediate: 5-10 lb weight/med ball<br>Advanced: 15-25+ lb weight/med ball |
-| Deadbugs         | Deep core coordination | Lie on back with arms and legs extended upward, lower opposite arm and leg toward floor while keeping back flat. | Beginner: Modified range<br>Intermediate: Full range<br>Advanced: Add resistance bands |
-
-You can also use these sample exercises in strength training programs. Prioritize glutes, hamstrings, core, and single-leg stability.
----
-| Exercise                            | Muscles Targeted                                 | Sets/Reps                   | Description                                                                                           | Suggested Weight Range                                                 |
-|:------------------------------------|:-------------------------------------------------|:----------------------------|-------------------------------------------------------------------------------------------------------|-----------------------------------------------------------------------|
-| Walking Lunges                      | Glutes, quads, core                              | 3x10 per leg                | Step forward into lunge position, lower back knee toward floor without touching it, push through front heel to bring feet together, then step forward with opposite leg. | Beginner: Bodyweight or 5-10 lb dumbbells<br>Intermediate: 15-25 lb dumbbells<br>Advanced: 30-40+ lb dumbbells |
-| Single Leg Calf Raise               | Calves, glutes, balance                          | 2x30 per leg                | Stand on one leg, rise onto ball of foot, lower heel toward ground with control, repeat without letting heel touch ground between reps. | Beginner: Bodyweight<br>Intermediate: 5-15 lb dumbbell<br>Advanced: 20-35+ lb dumbbell |
-| Bridge with Alternating Hip Flexion | Outer hips, glutes                               | 15 reps per side            | Lie on back with knees bent, lift hips into bridge position, extend one leg while maintaining level hips, return foot to floor, repeat on opposite side. | Beginner: Bodyweight<br>Intermediate: Mini band above knees<br>Advanced: 10-25 lb plate on hips |
-| Plank with Knee Dips                | Core, shoulders, hips, glutes                    | 10 dips per side            | Start in forearm plank position, rotate hips to dip one knee toward floor without touching, return to center, repeat on opposite side. | Beginner: Modified on knees<br>Intermediate: Full body<br>Advanced: Add ankle weights (2-5 lb) |
-| Side Plank                          | Core, obliques, shoulders                        | Hold 20-30 sec per side     | Balance on one forearm and outside edge of foot, create straight line from head to feet, hold position with hips lifted. | Beginner: Modified on knee<br>Intermediate: Full side plank<br>Advanced: Add top leg lift or weight |
-| Squat                               | Glutes, hamstrings, quads, core                  | 60 sec                      | Stand with feet shoulder-width apart, lower hips back and down until thighs are parallel to floor, then drive through heels to stand. | Beginner: Bodyweight<br>Intermediate: 10-25 lb dumbbells or kettlebell<br>Advanced: 30-50+ lb dumbbells or kettlebell |
-| Pistol Squat                        | Glutes, hamstrings, quads, calves, core          | As many as possible per leg | Balance on one leg with other leg extended forward, lower into one-legged squat as deep as possible, rise back up without losing balance. | Beginner: Assisted with TRX/pole<br>Intermediate: Partial range bodyweight<br>Advanced: Full range bodyweight |
-| X Lunge                             | Glutes, hamstrings, quads, core                  | 60 sec                      | Step backward diagonally into lunge, lowering until both knees reach 90°, push through front heel to return to start, alternate sides. | Beginner: Bodyweight<br>Intermediate: 8-15 lb dumbbells<br>Advanced: 20-35 lb dumbbells |
-| Pushups                             | Chest, shoulders, triceps, core, glutes, legs    | 60 sec                      | Start in plank position, lower chest to floor by bending elbows at 45° angle, push back up to straight arms. | Beginner: Modified on knees<br>Intermediate: Full body<br>Advanced: Feet elevated or weighted vest |
-| Burpee                              | Full body                                        | 60 sec                      | Squat down, place hands on floor, jump feet back to plank, perform push-up (optional), jump feet forward to squat, jump vertically with arms overhead. | Beginner: Step back/forward<br>Intermediate: Full burpee<br>Advanced: Add push-up or weight |
-| Single-Leg Jumping Lunge            | Glutes, hamstrings, quads, calves, core          | 30-60 sec                   | Start in lunge position, jump explosively upward switching legs in mid-air, land softly in lunge with opposite leg forward. | Beginner: Bodyweight alternating lunges<br>Intermediate: Bodyweight jumps<br>Advanced: Light dumbbells (3-8 lb) |
-| High-Knees Power Skip               | Glutes, hip flexors, legs, core                  | 60 sec                      | Skip with exaggerated knee lift and arm drive, focus on height and power rather than forward movement. | Beginner: Low intensity<br>Intermediate: Moderate height<br>Advanced: Maximum height/power |
-| Tuck Jump                           | Glutes, hip flexors, legs, core                  | 30-60 sec                   | From standing, jump explosively upward bringing knees toward chest, land softly with knees slightly bent. | Beginner: Lower height jumps<br>Intermediate: Full tuck<br>Advanced: Continuous maximum height |
-| Jump Squat                          | Glutes, hamstrings, quads, calves, core          | 30-60 sec                   | Lower into squat position, then explosively jump upward extending hips, knees, and ankles, land softly back into squat position. | Beginner: Bodyweight<br>Intermediate: Bodyweight with deeper squat<br>Advanced: Light dumbbells (5-15 lb) |
-| Box Jump                            | Glutes, legs, core                               | 30-60 sec                   | Stand facing box/platform, lower into quarter squat, jump onto box landing softly with bent knees, step or jump back down. | Beginner: 12-18" box<br>Intermediate: 20-24" box<br>Advanced: 24"+ box |
-| Medicine Ball Twist                 | Abs, obliques                                    | 30-60 sec                   | Sit with knees bent and feet elevated, hold medicine ball at chest, rotate torso to tap ball on floor beside hips, alternate sides. | Beginner: 4-6 lb ball<br>Intermediate: 8-10 lb ball<br>Advanced: 12-16+ lb ball |
-| Wall Ball                           | Glutes, legs, shoulders, arms, chest             | 30-60 sec                   | Face wall in squat position holding medicine ball at chest, simultaneously stand and throw ball upward against wall, catch on return and lower into squat. | Beginner: 6-8 lb ball<br>Intermediate: 10-14 lb ball<br>Advanced: 16-20+ lb ball |
-| Ball Slam                           | Shoulders, lats, arms, abs                       | 30-60 sec                   | Stand with feet shoulder-width apart, raise medicine ball overhead, forcefully slam ball to floor using abs and arms, catch on bounce and repeat. | Beginner: 6-8 lb ball<br>Intermediate: 10-15 lb ball<br>Advanced: 20-30+ lb ball |
-| Medicine Ball Clean                 | Glutes, hamstrings, quads, core, arms, shoulders | 30-60 sec                   | Start in squat position with ball on floor, lift ball in continuous motion from floor to chest while standing, return to start position. | Beginner: 6-10 lb ball<br>Intermediate: 12-16 lb ball<br>Advanced: 18-25+ lb ball |
-| Medicine Ball Thruster              | Glutes, hamstrings, quads, core, arms, shoulders | 30-60 sec                   | Hold medicine ball at chest, lower into squat, stand while simultaneously pressing ball overhead, return to start position. | Beginner: 6-8 lb ball<br>Intermediate: 10-14 lb ball<br>Advanced: 16-20+ lb ball |
-| Single-Leg Deadlift                 | Glutes, hamstrings, quads, core                  | 8-10 reps per leg           | Balance on one leg, hinge at hips while extending free leg behind you until torso is parallel to floor, return to standing. | Beginner: Bodyweight or 5-10 lb dumbbells<br>Intermediate: 15-25 lb dumbbells<br>Advanced: 30-40+ lb dumbbells |
-| Hang High Pull                      | Glutes, hamstrings, quads, core, arms, shoulders | 8-10 reps                   | Hold kettlebell/dumbbell between legs, hinge forward slightly, explosively extend hips while pulling weight up to chin height with elbows high. | Beginner: 15-25 lb kettlebell<br>Intermediate: 30-40 lb kettlebell<br>Advanced: 45-60+ lb kettlebell |
-| Snatch, Pull, and Push Press        | Glutes, hamstrings, quads, core, arms, shoulders | 8-10 reps                   | In one fluid motion, pull weight from floor to overhead while dipping slightly at knees, finish with weight locked out overhead. | Beginner: 15-25 lb kettlebell/dumbbell<br>Intermediate: 30-45 lb<br>Advanced: 50-70+ lb |
-| Half Get Up                         | Abs, shoulders, hip flexors                      | 5 reps per side             | Lie on back holding weight above shoulder, rise to seated position then to knee while keeping weight overhead, reverse movement to return to start. | Beginner: 5-10 lb kettlebell/dumbbell<br>Intermediate: 15-25 lb<br>Advanced: 30-40+ lb |
-| Swing                               | Glutes, hamstrings, quads, core, arms, shoulders | 10 reps                     | Hold kettlebell with both hands, hinge at hips swinging weight between legs, explosively extend hips to swing weight to chest height. | Beginner: 15-25 lb kettlebell<br>Intermediate: 30-40 lb kettlebell<br>Advanced: 45-60+ lb kettlebell |
-| Split Squat Kettlebell Pass         | Glutes, hamstrings, quads, core, arms, shoulders | 8-10 reps per leg           | Assume split squat position holding kettlebell in one hand, lower into squat while passing weight under front leg to other hand, rise and repeat. | Beginner: 10-15 lb kettlebell<br>Intermediate: 20-30 lb kettlebell<br>Advanced: 35-45+ lb kettlebell |
-| **Weighted Calf Raises**            | Calves, ankles, balance                          | 3x15 reps                   | Stand with feet hip-width apart, rise onto balls of feet as high as possible, lower heels with control, repeat. | Beginner: 10-20 lb dumbbells<br>Intermediate: 25-40 lb dumbbells<br>Advanced: 45-70+ lb barbell/dumbbells |
-| **Hip Thrusters**                   | Glutes, hamstrings, core                         | 3x10-12 reps                | Sit with upper back against bench, weight across hips, feet flat, drive through heels to lift hips until body forms straight line, squeeze glutes at top. | Beginner: 0-45 lb barbell<br>Intermediate: 65-95 lb barbell<br>Advanced: 135-185+ lb barbell |
-| **Single-Leg Split Squat**          | Glutes, quads, hamstrings, core                  | 3x8 reps per leg            | Place rear foot on bench, front foot forward, lower until front thigh is parallel to floor, push through front heel to rise. | Beginner: Bodyweight or 5-10 lb dumbbells<br>Intermediate: 15-25 lb dumbbells<br>Advanced: 30-45+ lb dumbbells |
-| **Side Lunge**                      | Glutes, inner thighs, quads, hamstrings          | 3x10 reps per side          | Stand with feet together, step wide to one side, bend target knee while keeping other leg straight, push through heel to return to start. | Beginner: Bodyweight or 5-10 lb dumbbells<br>Intermediate: 15-25 lb dumbbells<br>Advanced: 30-40+ lb dumbbells |
-| **Deadlift**                        | Hamstrings, glutes, lower back, core             | 3x6-10 reps                 | Stand with feet hip-width, hinge at hips with flat back, grip bar, push floor away through heels while keeping bar close to legs. | Beginner: 15-35 lb kettlebell/dumbbells<br>Intermediate: 65-95 lb barbell<br>Advanced: 115-185+ lb barbell |
-| **Single-Leg Romanian Deadlift**    | Hamstrings, glutes, balance, core                | 3x8 reps per leg            | Balance on one leg, hinge at hip while extending free leg behind you, lower weight toward floor maintaining flat back, return to standing. | Beginner: 8-15 lb dumbbells<br>Intermediate: 20-30 lb dumbbells<br>Advanced: 35-50+ lb dumbbells |
-
-</TABLE>
-
-"""
+# Kept in a separate file so the coaching content can be edited without
+# touching code; only read once a plan is generated
+KNOWLEDGE_BASE_PATH = Path(__file__).parent / "knowledge_base.md"
 
 SYSTEM_PROMPT = """
   You are an encouraging, passionate 34-year old female running coach for female endurance athletes who has specialized knowledge in female runners, strength training, physical therapy, female-specific nutrition, women's health, and sports psychology.
@@ -1359,23 +299,34 @@ EVEN BETTER, suggest that a user who is gluten-free use corn tortillas, which ar
 
 """
 
-TRAINING_PLAN_PROMPT =  f"""
+
+@lru_cache(maxsize=1)
+def get_training_plan_system_prompt():
+    """
+    Return the static part of the prompt, built on first use.
+
+    It is sent as the system message so the provider can cache it, so it must
+    be byte-identical across calls: keep anything per-user out of it.
+    """
+    knowledge_base = KNOWLEDGE_BASE_PATH.read_text(encoding="utf-8")
+    return f"""
 {SYSTEM_PROMPT}
 
 ===
 
 # Knowledge base
 
-{KNOWLEDGE_BASE_PROMPT}
+{knowledge_base}
 
 ===
 
 # Guidelines for a good training plan
 
 {GUIDELINES}
+"""
 
-===
 
+TRAINING_PLAN_PROMPT =  f"""
 Today is {{today}}. Each week begins on Monday and ends on Sunday. Write your plan starting from tomorrow to the end of this week and then for the next two weeks up to ({{up_to_date}}).
 
 ===
@@ -1492,624 +443,76 @@ SHOT_1_INPUT = {
   }
 }
 
-SHOT_1_OUTPUT = """
-```yaml
-reasoning: |
-  Rosie is a 26-year-old beginner runner with a history of shin splints. Her primary goals include building enough endurance to run continuously without stopping, stress management, and learning about female-specific training. At 5'3" and 150 lbs, she currently runs about twice per week and participates in other activities like strength training, yoga, swimming, and cycling.
-  Given her beginner status and history of shin splints, I've designed a progressive 12-week plan that starts with run/walk intervals and gradually builds endurance while prioritizing injury prevention. The plan respects her preferred schedule (workouts on M/W/F, long runs on Saturday, rest on Sunday) and incorporates her other activities as beneficial cross-training and sources of fun.
-  To prevent her from getting overwhelmed (a past issue), I've kept the structure simple and consistent. I've included detailed guidance on pre-run activation and post-run mobility specific to shin splint prevention. Strength training is incorporated twice weekly with an emphasis on lower body and core strength to support running mechanics and prevent injury.
-  The nutrition guidance focuses on proper fueling for female athletes according to Stacy Sims' overall principles and guidance for an endomorph body type, with an emphasis on protein intake and recovery nutrition.
-goal: Build endurance slowly and sustainably, prevent shin splints, and help Rosie find confidence and consistency in running.
-sms_message: "Hey Rosie! This is Emmi! Here's the first few weeks of your personalized training plan: https://emmi.com/plans/1234. I've designed it to help you achieve your goals while avoiding pesky shin splints. Let me know what you think and feel free to text me anytime if you have questions or need modifications!"
-weeks:
-  - goal: "Hey Rosie! I'm so excited to be on this journey with you! For Week 0 (March 20-23), we're easing into strength training and run/walk workouts. These first few sessions will help your body start adapting to training stimulus before we begin a full week. Focus on form over intensity, and don't hesitate to reach out with any questions!"
-    week_start_date: "2025-03-17"
-    dates:
-      - date: "2025-03-20"
-        workouts:
-          - type: "Strength Training"
-            title: "Foundational Strength"
-            summary: "Develop foundational strength to protect shins, knees, and hips."
-            notes: "Hey Rosie! For this first strength session, focus on control and form over resistance. We're easing into strength training to make sure your shins, knees, and hips stay happy and healthy as you start running. Muscle activation and mobility are essential! They will help your body manage the increased training load."
-            duration: 50
-            distance: null
-            focus: "full_body"
-            effort: "4"
-            steps:
-              - name: "Muscle Activation"
-                description: |
-                  - Toe Yoga: Lift big toe while lowering others and pressing hard into floor, then reverse; 10 reps per foot
-                  - Heel Walks: Walk on heels with toes up; 30s x 3 rounds
-                  - Monster Walks: Band above knees, take wide steps sideways with tension in glutes; 3x10 steps each way
-                  - Foam roll calves: Roll under calf muscles, pause on tight spots; 1-2 min
-              - name: "Lower Body"
-                description: |
-                  - Goblet Squat: Hold weight at chest, lower until thighs parallel; 3x10 reps with 15-20 lb kettlebell
-                  - Romanian Deadlifts: Hinge at hips with flat back until weights reach mid-shin; 3x8 reps with 15-30 lb total
-                  - Calf Raises: Rise onto balls of feet, lower slowly; 3x12 reps with bodyweight or 5-10 lb dumbbells
-              - name: "Upper Body"
-                description: |
-                  - Dumbbell Shoulder Press: Press weights from shoulders to overhead; 3x10 reps with 8-15 lb dumbbells
-                  - Bent-over Rows: Hinge forward, pull weights to ribcage; 3x10 reps with 10-15 lb dumbbells
-              - name: "Core Stability"
-                description: |
-                  - Plank with Hip Drivers: Hold plank, rotate one hip down then up; 3x30 sec each side
-                  - Deadbugs: Lie on back, extend opposite arm/leg while keeping back flat; 3x12 reps
-              - name: "Mobility"
-                description: |
-                  - Foam roll calves and quads: 3-5 min
-                  - Hip flexor stretch
-                  - Seated hamstring stretch
-                  - Figure 4 glute stretch
-            before_tips:
-              - "30-45 mins pre-workout: Greek Yogurt + Berries (½ cup plain Greek yogurt + ½ cup mixed berries + cinnamon, ~12g protein, ~15g carbs)"
-              - "Try to fuel properly with protein and carbs before workouts! Fasted training disrupts females' normal hormonal function and increases injury risk."
-            after_tips:
-              - "Within 30 mins: Green Goddess Smoothie (1 scoop protein powder + ½ banana + 1 cup unsweetened almond milk + ½ tbsp chia or flaxseeds + handful of spinach, ~30g protein + healthy fats, fiber, carbs for muscle repair)"
-              - "Eating a protein-rich snack or meal within 30 minutes of your run will maximize your recovery window, repair those hardworking muscles, and help your body adapt to training more effectively."
-      - date: "2025-03-21"
-        workouts:
-          - type: "Cross Training"
-            title: "Low-Impact Cardio"
-            summary: "Maintain aerobic fitness without impact on shins."
-            notes: "Today should feel refreshing, not exhausting. We're cross-training today to let your body recover from its first strength session! Keep it light and move your body in any way that feels good."
-            duration: 40
-            distance: null
-            focus: null
-            effort: "3"
-            steps:
-              - name: "Cardio (pick one)"
-                description: |
-                  - Cycling: 20-30 min at low-moderate effort
-                  - Swimming: 25-30 min of steady laps
-              - name: "Post-Workout Mobility"
-                description: |
-                  - Foam roll calves, quads, IT band: Roll slowly, pause on tender spots; 3-5 min
-                  - Hip flexor stretch
-                  - Seated hamstring stretch
-                  - Figure 4 glute stretch
-            before_tips:
-              - "30-45 mins pre-workout: Protein-Boosted Toast (1 slice sprouted grain toast with almond butter mixed with protein powder and some water + pinch of salt, ~12g protein, ~15g carbs)"
-            after_tips:
-              - "Within 60 mins: Turkey Hummus Plate (3oz sliced turkey + 2 tbsp hummus + your favorite veggies, ~21g protein, ~10g carbs)"
-      - date: "2025-03-22"
-        workouts:
-          - type: "Easy Run"
-            title: "First Run/Walk Session"
-            summary: "Build aerobic endurance using short running intervals with plenty of recovery walking."
-            notes: "Hey Rosie! For your first run/walk session, try to stay light on your feet and aim to take short, quick steps to keep a high cadence and minimize impact on your shins. Muscle activation exercises will also help prime your body to support proper running form!"
-            duration: 35
-            distance: null
-            focus: null
-            effort: "3"
-            steps:
-              - name: "Muscle Activation"
-                description: |
-                  - Toe Yoga: Lift big toe while lowering others, then reverse; 10 reps per foot
-                  - Heel Walks: Walk on heels with toes up; 30s x 3 rounds
-                  - Monster Walks: Band above knees, take wide steps sideways with tension in glutes; 2x10 steps each way
-                  - Foam roll calves: Roll under calf muscles, pause on tight spots; 1-2 min
-              - name: "Running Workout"
-                description: |
-                  - 5 min warm-up walk
-                  - 15 min alternating 30s run / 60s walk
-                  - 5 min cooldown walk
-              - name: "Post-Run Mobility"
-                description: |
-                  - Foam roll calves, quads, IT band: 3-5 min
-                  - Hip flexor stretch
-                  - Seated hamstring stretch
-                  - Figure 4 glute stretch
-            before_tips:
-              - "30-45 mins pre-run: Protein Almond Milk (1 cup unsweetened almond milk + ½ scoop protein powder, ~15g protein, ~2g carbs)"
-            after_tips:
-              - "Within 30 mins: Nutty Banana Greek Yogurt (1 cup Greek yogurt + ½ banana + 1 tbsp chopped walnuts, ~23g protein, ~20g carbs)"
-      - date: "2025-03-23"
-        workouts:
-          - type: "Rest and Recovery"
-            title: "Complete Rest Day"
-            summary: "Complete recovery day to allow your body to adapt to our first training sessions."
-            notes: "Hey Rosie! Congrats on making it through Week 0! If you're feeling tight or stiff, light stretching or yoga would be great. Could also take a short walk to loosen up your legs but try to take it easy!"
-            duration: null
-            distance: null
-            focus: null
-            effort: "Rest"
-            steps: []
-            before_tips:
-              - "Protein is key for recovery: Prioritize protein from lean meats, fish, eggs, Greek yogurt, tofu, and legumes to aid in muscle repair and rebuilding."
-              - "Carbs and healthy fats support hormone health: Slow-digesting, fiber-rich carbs like sweet potatoes, oats, and brown rice and healthy fats from nuts, fish, olive oil, and avocados help support hormone health and inflammation reduction."
-              - "Listen to hunger cues: Make sure you're still eating plenty! Given that you just increased your activity level, you might be hungrier than usual, an indication that you're underfueling on training days. To be a strong, healthy runner, you need to be a well-fueled runner!"
-  - goal: "Rosie! We're off to the races! The goal for Week 1 is to establish a running and strength routine with a controlled run/walk structure that keeps your legs happy and injury-free.
-    Given your history of shin splints, try to continue doing your pre-workout calf exercises, hip flexor stretching, and calf rolling! Running on softer surfaces like a dirt trail, track, or treadmill can also help. Also try to fuel with healthy, whole foods to help your body adjust to your increased training load. Feel free to text me if you have any questions or need modifications! :)"
-    week_start_date: "2025-03-24"
-    dates:
-      - date: "2025-03-24"
-        workouts:
-          - type: "Easy Run"
-            title: "Your Second Run/Walk Session"
-            summary: "Slightly longer total running time, but with ample walk recovery."
-            notes: "Welcome to the beginning of Week 1 and Run #2! Try to stay light on your feet and aim for short, quick steps with high cadence (~170) to minimize impact. Think of muscle activation and post-run mobility as your insurance policy against injury--a few minutes each day keeps the doctor away! You got this!"
-            duration: 40
-            distance: null
-            focus: null
-            effort: "3"
-            steps:
-              - name: "Muscle Activation"
-                description: |
-                  - Toe Yoga: Lift big toe while lowering others, then reverse; 10 reps per foot
-                  - Heel Walks: Walk on heels with toes up; 30s x 3 rounds
-                  - Monster Walks: Band above knees, take wide steps sideways and keep tension in glutes; 2x10 steps each way
-                  - Foam roll calves: Roll under calf muscles, pause on tight spots; 1-2 min
-              - name: "Running Workout"
-                description: |
-                  - 5 min warm-up walk
-                  - 20 min alternating 30s run / 60s walk
-                  - 5 min cooldown walk
-              - name: "Post-Run Mobility"
-                description: |
-                  - Foam roll calves, quads, IT band: Roll slowly, pause on tender spots; 3-5 min
-                  - Hip flexor stretch
-                  - Seated hamstring stretch
-                  - Figure 4 glute stretch
-            before_tips:
-              - "Within 30 mins: Protein Toast (1 slice sprouted whole grain toast with a thin layer of almond butter, a thin layer of greek yogurt, and a pinch of salt (~12g protein, ~15g carbs)"
-              - "Remember to fuel before workouts! Just a bit of protein and carbs makes a big difference!"
-            after_tips:
-              - "Within 30 mins: Berry Power Smoothie (1 cup unsweetened almond milk + 1 scoop protein powder + ½ cup berries + 1 tbsp cacao powder + spinach, ~25g protein, ~25g carbs)"
-              - "To lock in your gains and feel strong in your strength session, try to eat a protein-rich snack or meal within 30 minutes of your run."
-          - type: "Strength Training"
-            title: "Lower Body and Core"
-            summary: "Reinforce lower body and core stability to support increased running load."
-            notes: "Hey Rosie! For this strength session, continue focusing on control and form over resistance. We're still easing in and have plenty of time to increase weight in future weeks! The two sessions today might seem hard, but tomorrow will give you time to recover!"
-            duration: 40
-            distance: null
-            focus: "core_lower_body"
-            effort: "4"
-            steps:
-              - name: "Pre-Workout Activation"
-                description: |
-                  - Toe Yoga: Lift big toe while lowering others, then reverse; 10 reps per foot
-                  - Heel Walks: Walk on heels with toes up; 30s x 3 rounds
-                  - Monster Walks: Band above knees, take wide steps sideways; 3x10 each way
-                  - Foam roll calves: Roll under calf muscles, pause on tight spots; 1-2 min
-              - name: "Lower Body"
-                description: |
-                  - Glute Bridges: Lie on back with knees bent, lift hips until body forms straight line; 3x15 with bodyweight or 10-20 lb plate on hips
-                  - Side-Lying Clamshells: Lie on side, knees bent, lift top knee while keeping feet together; 3x10 per side with mini-band
-                  - Single Leg Romanian Deadlifts: Balance on one leg, hinge forward with flat back; 3x8 per leg with 8-15 lb dumbbells
-                  - Calf Raises: Rise onto balls of feet, lower slowly; 3x12 with bodyweight or 5-10 lb dumbbells
-              - name: "Core Stability"
-                description: |
-                  - Plank with Hip Drivers: Hold plank, rotate one hip down then up; 3x30 sec each side
-                  - Deadbugs: Lie on back, extend opposite arm/leg while keeping back flat; 3x12
-              - name: "Mobility"
-                description: |
-                  - Foam roll calves and quads: Roll slowly, pause on tender spots; 3-5 min
-                  - Hip flexor stretch
-                  - Seated hamstring stretch
-                  - Figure 4 glute stretch
-            before_tips:
-              - "Within 30 min: Yogurt Banana Snack (½ cup plain Greek yogurt + ½ banana (~15 protein,~20 carbs for energy!)"
-            after_tips:
-              - "Ideally within 30-60 mins: Salmon Quinoa Bowl (4oz baked salmon + ⅓ cup quinoa + roasted vegetables + your favorite spices, ~28g protein, ~20g carbs)"
-      - date: "2025-03-25"
-        workouts:
-          - type: "Cross Training"
-            title: "Low-Impact Cardio"
-            summary: "Improve cardiovascular fitness without extra impact on shins."
-            notes: "Keep it light and fun! Enjoy moving your body while giving your legs take a break from running.
-            Pick an activity that excites you and jam out to some music! Remember to take time afterward to roll, stretch, and give your body some love."
-            duration: 40
-            distance: null
-            focus: null
-            effort: "3"
-            steps:
-              - name: "Workout Options (Pick one!)"
-                description: |
-                  - Cycling: 20-30 min at low-moderate effort
-                  - Swimming: 25-30 min steady laps
-                  - Elliptical: 20-30 min easy strides
-              - name: "Post-Workout Mobility"
-                description: |
-                  - Foam roll calves, quads, IT band: Roll slowly, pause on tender spots; 3-5 min
-                  - Hip flexor stretch
-                  - Figure 4 glute stretch
-            before_tips:
-              - "15-30 mins pre-workout: Edamame (¼ cup shelled edamame with sea salt, ~8g protein, ~10g carbs)"
-            after_tips:
-              - "Within 60 mins: Berry Seedy Cottage Cheese (1 cup cottage cheese + ½ cup berries + 1 tbsp pumpkin seeds, ~28g protein, ~15g carbs)"
-      - date: "2025-03-26"
-        workouts:
-          - type: "Easy Run"
-            title: "Progressive Run/Walk Session"
-            summary: "Running intervals get slightly longer, allowing your body to adapt to more continuous movement."
-            notes: "This is progress! If needed, stay at this week's earlier 30 second intervals until they feel easy before advancing. And let me know how it goes in the workout notes, so I can keep your plan current!"
-            duration: 40
-            distance: null
-            focus: null
-            effort: "3"
-            steps:
-              - name: "Muscle Activation (Pre-Run)"
-                description: |
-                  - Toe Yoga: Lift big toe while lowering others, then reverse; 10 reps per foot
-                  - Heel Walks: Walk on heels with toes up; 30s x 3 rounds
-                  - Monster Walks: Band above knees, take wide steps sideways; 2x10 steps each way
-                  - Foam roll calves: Roll under calf muscles, pause on tight spots; 1-2 min
-              - name: "Running Workout"
-                description: |
-                  - 5 min warm-up walk
-                  - 20 min alternating 45s run / 60s walk
-                  - 5 min cooldown walk
-              - name: "Post-Run Mobility"
-                description: |
-                  - Foam roll calves, quads, IT band: Roll slowly, pause on tender spots; 3-5 min
-                  - Hip flexor stretch
-                  - Figure 4 glute stretch
-            before_tips:
-              - "30 mins pre-workout: Hard-boiled Eggs (2 hard-boiled eggs, ~12g protein)"
-            after_tips:
-              - "Within 30-60 mins: Chocolate Berry Smoothie (1 cup almond milk + 1 scoop protein powder + ½ cup berries + 1 tbsp cacao powder, ~25g protein, ~15g carbs)"
-              - "As you develop a routine, you'll figure out what pre and post workout snacks feel best! Just make sure to eat enough protein, carbs, and healthy fats before and after your workouts!
-              Women are much more sensitive to inter-day fueling deficits, and we want you to be healthy and strong."
-      - date: "2025-03-27"
-        workouts:
-          - type: "Strength Training"
-            title: "Foundational Strength"
-            summary: "Strengthen the glutes, core, and stabilizers to protect your shins as running volume increases."
-            notes: "Hey Rosie! Congrats on making it your THIRD strength session. You rock! You're making great progress with your consistency! Continue to focus on control and good form over heavy weights. "
-            duration: 50
-            distance: null
-            focus: "core_stability"
-            effort: "4"
-            steps:
-              - name: "Muscle Activation"
-                description: |
-                  - Toe Yoga: Lift big toe while lowering others and pressing hard into floor, then reverse; 10 reps per foot
-                  - Heel Walks: Walk on heels with toes up; 30s x 3 rounds
-                  - Monster Walks: Band above knees, take wide steps sideways with tension in glutes; 3x10 steps each way
-                  - Foam roll calves: Roll under calf muscles, pause on tight spots; 1-2 min
-              - name: "Lower Body"
-                description: |
-                  - Goblet Squat: Hold weight at chest, lower until thighs parallel; 3x10 reps with 15-20 lb kettlebell
-                  - Romanian Deadlifts: Hinge at hips with flat back until weights reach mid-shin; 3x8 reps with 15-30 lb total
-                  - Calf Raises: Rise onto balls of feet, lower slowly; 3x12 reps with bodyweight or 5-10 lb dumbbells
-              - name: "Upper Body"
-                description: |
-                  - Dumbbell Shoulder Press: Press weights from shoulders to overhead; 3x10 reps with 8-15 lb dumbbells
-                  - Bent-over Rows: Hinge forward, pull weights to ribcage; 3x10 reps with 10-15 lb dumbbells
-              - name: "Core Stability"
-                description: |
-                  - Plank with Hip Drivers: Hold plank, rotate one hip down then up; 3x30 sec each side
-                  - Deadbugs: Lie on back, extend opposite arm/leg while keeping back flat; 3x12 reps
-              - name: "Mobility"
-                description: |
-                  - Foam roll calves and quads: 3-5 min
-                  - Hip flexor stretch
-                  - Seated hamstring stretch
-                  - Figure 4 glute stretch
-            before_tips:
-              - "30-60 mins pre-strength: Fruity Cottage Cheese (⅔ cup cottage cheese + ½ cup berries, ~19g protein, ~10g carbs)"
-            after_tips:
-              - "Ideally within 30 mins: Sweet Potato Chicken Plate (4oz baked chicken breast + 1 baked sweet potato + lots of steamed broccoli, ~28g protein, ~30g carbs)"
-      - date: "2025-03-28"
-        workouts:
-          - type: "Cross Training"
-            title: "TGIF Cardio"
-            summary: "Improve cardiovascular fitness without extra impact on shins."
-            notes: "Happy Friday, Rosie! We're keeping it light today to allow your body to recover in advance of tomorrow's long run. Use today to reflect on how you've been feeling, and let me know if you have any questions or need modifications."
-            duration: 40
-            distance: null
-            focus: null
-            effort: "3"
-            steps:
-              - name: "Workout Options (Pick one!)"
-                description: |
-                  - Cycling: 20-30 min at low-moderate effort
-                  - Swimming: 25-30 min steady laps
-                  - Elliptical: 20-30 min easy strides
-              - name: "Post-Workout Mobility"
-                description: |
-                  - Foam roll calves, quads, IT band: Roll slowly, pause on tender spots; 3-5 min
-                  - Hip flexor stretch
-                  - Figure 4 glute stretch
-            before_tips:
-              - "30-45 mins pre-workout: Protein-Boosted Toast (1 slice sprouted grain toast with almond butter mixed with protein powder + a bit of water + pinch of salt, ~12g protein, ~15g carbs)"
-            after_tips:
-              - "Within 60 mins: Nutty Banana Greek Yogurt (1 cup Greek yogurt + ½ banana + 1 tbsp chopped walnuts, ~23g protein, ~20g carbs)"
-      - date: "2025-03-29"
-        workouts:
-          - type: "Long Run"
-            title: "Endurance Builder"
-            summary: "Gradually extend time on feet with 25 minutes of 45 seconds run/60 seconds walk."
-            notes: "Today is your second 'long run' day! Take it slow and easy, no rush! The goal is to extend time on feet for your longest running distance yet. If possible, try to find a soft surface like a trail, track, or treadmill. You got this!"
-            duration: 35
-            distance: null
-            focus: null
-            effort: "3"
-            steps:
-              - name: "Muscle Activation"
-                description: |
-                  - Toe Yoga: Lift big toe while lowering others, then reverse; 10 reps per foot
-                  - Heel Walks: Walk on heels with toes up; 30s x 3 rounds
-                  - Monster Walks: Band above knees, take wide steps sideways; 2x10 steps each way
-                  - Foam roll calves: Roll under calf muscles, pause on tight spots; 1-2 min
-              - name: "Running Workout"
-                description: |
-                  - 5 min warm-up walk
-                  - 25 min alternating 45s run / 60s walk
-                  - 5 min cool down walk
-              - name: "Post-Run Recovery"
-                description: |
-                  - Foam roll calves, quads, IT band: Roll slowly, pause on tender spots; 3-5 min
-                  - Static stretching: Quads, hamstrings, calves, glutes
-                  - Consider icing calves/shins for 15-20 minutes
-            before_tips:
-              - "60-90 mins pre-long run: Banana Oat Pancakes (Mix together one banana + 1/3 cup oats + 1 egg + 1 scoop protein powder + dash cinnamon into pancake batter and top with chocolate chips or blueberries, ~25g protein, ~40g carbs)"
-              - "Fuel up with something fun before your long run! It is the weekend after all!"
-            after_tips:
-              - "Ideally within 30 mins: Festive Recovery Brunch (Options: More protein pancakes, egg white veggie omelet, Greek yogurt parfait, or avocado toast with eggs, ~25-30g protein, ~30-40g carbs)"
-              - "Meet up with some friends to celebrate life and how awesome you are!"
-      - date: "2025-03-30"
-        workouts:
-          - type: "Rest and Recovery"
-            title: "Complete Rest Day"
-            summary: "Complete recovery day to allow your body to adapt to the week's training stimulus."
-            notes: "Take it easy today, Rosie! Light stretching or yoga is optional. You might consider treating yourself to a massage. :) We're building good habits with these consistent rest days!"
-            duration: null
-            distance: null
-            focus: null
-            effort: "Rest"
-            steps: []
-            before_tips:
-              - "In addition to protein, consider adding magnesium-rich foods to meals(leafy greens, fish, avocado, dark chocolate) to support muscle recovery"
-              - "Hydrate consistently throughout the day - aim for at least 64oz of water."
-              - "Make sure your listening to hunger cues and fueling enough to support all the rebuilding your body is doing!"
-  - goal: "Week 2 is about stability and small progressions! You're doing great—let's keep the consistency going! Your run/walk intervals will get just a little longer, but remember, progress doesn't have to be fast to be effective. Pay attention to shin discomfort; keep up with pre-run activation, post-run mobility, and strength work to support your lower legs. And don't forget to fuel properly—your body needs energy to adapt and get stronger!"
-    week_start_date: "2025-03-31"
-    dates:
-      - date: "2025-03-31"
-        workouts:
-          - type: "Easy Run"
-            title: "Chill Run/Walk Session"
-            summary: "Maintaining 45-second run intervals while focusing on form and comfort."
-            notes: "Hey Rosie, We're developing a routine! Yay! Keep focused on your running form today--light, quick steps and a relaxed upper body will help prevent shin pain. If you're feeling good, you can try 60-second intervals for part of the workout."
-            duration: 30
-            distance: null
-            focus: null
-            effort: "3"
-            steps:
-              - name: "Muscle Activation (Pre-Run)"
-                description: |
-                  - Toe Yoga: Lift big toe while lowering others, then reverse; 10 reps per foot
-                  - Heel Walks: Walk on heels with toes up; 30s x 3 rounds
-                  - Monster Walks: Band above knees, take wide steps sideways; 2x10 steps each way
-                  - Foam roll calves: Roll under calf muscles, pause on tight spots; 1-2 min
-              - name: "Running Workout"
-                description: |
-                  - 5 min warm-up walk
-                  - 20 min alternating 45s run / 60s walk
-                  - 5 min cooldown walk
-              - name: "Post-Run Mobility"
-                description: |
-                  - Foam roll calves, quads, IT band: Roll slowly, pause on tender spots; 3-5 min
-                  - Hip flexor stretch
-                  - Seated hamstring stretch
-                  - Figure 4 glute stretch
-            before_tips:
-              - "30-45 mins pre-run: Protein Almond Milk (1 cup unsweetened almond milk + ½ scoop protein powder, ~15g protein, ~2g carbs)"
-              -"8-12oz of water with electrolytes to ensure you're properly hydrated."
-            after_tips:
-              - "Ideally within 30 mins: Spinach Feta Egg Wrap (Scrambled egg whites + feta + hanful of spinach in whole wheat wrap, ~25g protein, ~20g carbs)"
-          - type: "Strength Training"
-            title: "Lower Body Power"
-            summary: "Continue building lower body and core strength to support running mechanics."
-            notes: "As we start the new week, focus on quality movements and proper form. You've been consistent for almost two weeks now—your body is adapting nicely! We'll start to add some variety to your strength routine once we establish routine and a strong base."
-            duration: 45
-            distance: null
-            focus: "lower_body"
-            effort: "4"
-            steps:
-              - name: "Pre-Workout Activation"
-                description: |
-                  - Toe Yoga: Lift big toe while lowering others, then reverse; 10 reps per foot
-                  - Heel Walks: Walk on heels with toes up; 30s x 3 rounds
-                  - Monster Walks: Band above knees, take wide steps sideways; 3x10 each way
-                  - Foam roll calves: Roll under calf muscles, pause on tight spots; 1-2 min
-              - name: "Lower Body"
-                description: |
-                  - Glute Bridges: Lie on back with knees bent, lift hips until body forms straight line; 3x15 with bodyweight or 10-20 lb plate on hips
-                  - Side-Lying Clamshells: Lie on side, knees bent, lift top knee while keeping feet together; 3x10 per side with mini-band
-                  - Single Leg Romanian Deadlifts: Balance on one leg, hinge forward with flat back; 3x8 per leg with 8-15 lb dumbbells
-                  - Calf Raises: Rise onto balls of feet, lower slowly; 3x12 with bodyweight or 5-10 lb dumbbells
-              - name: "Core Stability"
-                description: |
-                  - Plank with Hip Drivers: Hold plank, rotate one hip down then up; 3x30 sec each side
-                  - Deadbugs: Lie on back, extend opposite arm/leg while keeping back flat; 3x12
-              - name: "Mobility"
-                description: |
-                  - Foam roll calves and quads: Roll slowly, pause on tender spots; 3-5 min
-                  - Hip flexor stretch
-                  - Seated hamstring stretch
-                  - Figure 4 glute stretch
-            before_tips:
-              - "30-60 mins pre-strength: Berry Yogurt (1 cup Greek yogurt + ½ cup berries, ~23g protein, ~10g carbs)"
-            after_tips:
-              - "Ideally within 30-60 mins: Chicken Veggie Stir-Fry (4oz chicken breast + your favorite mixed vegetables and butternut squash + 2 tsp olive oil + 1/2 cup brown rice, ~28g protein, ~40g carbs)"
-              - "Stay hydrated throughout the evening - aim for another 16-20oz of water before bed."
-      - date: "2025-04-01"
-        workouts:
-          - type: "Cross Training"
-            title: "Recovery Cardio"
-            summary: "Maintain cardiovascular fitness while giving legs a break from impact."
-            notes: "This is your third consecutive week with cross-training—great consistency! So proud of you, Rosie! Keep it enjoyable at a moderate intensity."
-            duration: 40
-            distance: null
-            focus: null
-            effort: "3"
-            steps:
-              - name: "Workout Options (Pick one!)"
-                description: |
-                  - Cycling: 25-35 min at low-moderate effort
-                  - Swimming: 25-35 min steady laps
-                  - Elliptical: 25-35 min easy strides
-              - name: "Post-Workout Mobility"
-                description: |
-                  - Foam roll calves, quads, IT band: Roll slowly, pause on tender spots; 3-5 min
-                  - Hip flexor stretch
-                  - Figure 4 glute stretch
-                  - Calf stretch
-            before_tips:
-              - "15-30 mins pre-workout: Antioxidant Smoothie (1 cup almond milk + 1 scoop protein powder + ½ cup blueberries + handful spinach + dash of cinnamon, ~25g protein, ~15g carbs)"
-            after_tips:
-              - "Within 60 mins: Mini Turkey Wrap (3oz turkey slices + 1/4 avo + lettuce on yellow corn tortilla, ~21g protein, ~15g carbs)"
-      - date: "2025-04-02"
-        workouts:
-          - type: "Easy Run"
-            title: "Progressive Run/Walk Session"
-            summary: "Increasing run intervals to 60 seconds with equal recovery."
-            notes: "Today, we're aiming for consistent 60-second intervals of 60 sec run / 60 sec walk. This is a big deal! If your shins feel good, this is a nice progression! If you feel any discomfort, it's perfectly fine to drop back to 45-second intervals. Way to be here, Rosie!"
-            duration: 45
-            distance: null
-            focus: null
-            effort: "3"
-            steps:
-              - name: "Muscle Activation (Pre-Run)"
-                description: |
-                  - Toe Yoga: Lift big toe while lowering others, then reverse; 10 reps per foot
-                  - Heel Walks: Walk on heels with toes up; 30s x 3 rounds
-                  - Monster Walks: Band above knees, take wide steps sideways; 2x10 steps each way
-                  - Foam roll calves: Roll under calf muscles, pause on tight spots; 1-2 min
-              - name: "Running Workout"
-                description: |
-                  - 5 min warm-up walk
-                  - 20 min alternating 60s run / 60s walk
-                  - 5 min cooldown walk
-              - name: "Post-Run Mobility"
-                description: |
-                  - Foam roll calves, quads, IT band: Roll slowly, pause on tender spots; 3-5 min
-                  - Hip flexor stretch
-                  - Seated hamstring stretch
-                  - Figure 4 glute stretch
-            before_tips:
-              - "30-45 mins pre-run: Pineapple Cottage Cheese (1/2 cup cottage cheese + ¼ cup pineapple chunks, ~15g protein, ~10g carbs)"
-            after_tips:
-              - "Ideally within 30 mins: Energizing Green Smoothie (1 cup almond milk + 1 scoop protein powder + spinach + ½ banana + ½ cucumber + ¼ avocado + grated ginger, ~25g protein, ~15g carbs)"
-      - date: "2025-04-03"
-        workouts:
-          - type: "Strength Training"
-            title: "Celebratory Strength"
-            summary: "Final strength session of three-week block focusing on full-body stability."
-            notes: "Congratulations on almost completing three weeks of consistent training! This strength session will help lock in the gains you've made and prepare you for next week."
-            duration: 45
-            distance: null
-            focus: "full_body"
-            effort: "4"
-            steps:
-              - name: "Muscle Activation"
-                description: |
-                  - Toe Yoga: Lift big toe while lowering others, then reverse; 10 reps per foot
-                  - Heel Walks: Walk on heels with toes up; 30s x 3 rounds
-                  - Monster Walks: Band above knees, take wide steps sideways; 3x10 steps each way
-                  - Foam roll calves: Roll under calf muscles, pause on tight spots; 1-2 min
-              - name: "Lower Body"
-                description: |
-                  - Single-Leg Glute Bridges: Lie on back, one leg extended, lift hips; 3x10 per side with bodyweight
-                  - Side-Lying Clamshells: Lie on side, knees bent, lift top knee while keeping feet together; 3x10 per side with mini-band
-                  - Step-Ups: Step onto bench, drive through heel to stand, lower with control; 3x8 per leg with 8-15 lb dumbbells
-                  - Calf Raises: Rise onto balls of feet, lower slowly; 3x15 with bodyweight or 10-20 lb dumbbells
-              - name: "Upper Body"
-                description: |
-                  - Push-Ups: Standard or modified on knees; 3x8-12 reps
-                  - Bent-over Rows: Hinge forward, pull weights to ribcage; 3x10 with 10-15 lb dumbbells
-              - name: "Core Stability"
-                description: |
-                  - Plank with Hip Drivers: Hold plank, rotate one hip down then up; 3x30 sec each side
-                  - Deadbugs: Lie on back, extend opposite arm/leg while keeping back flat; 3x12
-              - name: "Mobility"
-                description: |
-                  - Foam roll calves and quads: Roll slowly, pause on tender spots; 3-5 min
-                  - Hip flexor stretch
-                  - Seated hamstring stretch
-                  - Figure 4 glute stretch
-            before_tips:
-              - "30-60 mins pre-strength: Greek yogurt with apple and cinnamon (¾ cup Greek yogurt + ½ small apple + cinnamon, ~18g protein, ~10g carbs)"
-            after_tips:
-              - "Ideally within 30-60 mins: Seafood curry with vegetables (4oz white fish or shrimp + curry spices + vegetables + ¼ cup brown rice, ~28g protein, ~15g carbs)"
-      - date: "2025-04-04"
-        workouts:
-          - type: "Cross Training"
-            title: "Friday Fun Cardio"
-            summary: "Improve cardiovascular fitness without extra impact on shins."
-            notes: "As always, these days are meant to help you improve cardio with minimal impact or stress on your body. Keep these sessions joyous and tap into mindfulness practices if you have them. Move, sweat a little, take deep breaths, and stretch afterward."
-            duration: 40
-            distance: null
-            focus: null
-            effort: "3"
-            steps:
-              - name: "Workout Options (Pick one!)"
-                description: |
-                  - Cycling: 20-30 min at low-moderate effort
-                  - Swimming: 25-30 min steady laps
-                  - Elliptical: 20-30 min easy strides
-              - name: "Post-Workout Mobility"
-                description: |
-                  - Foam roll calves, quads, IT band: Roll slowly, pause on tender spots; 3-5 min
-                  - Hip flexor stretch
-                  - Figure 4 glute stretch
-            before_tips:
-              - "15-30 mins pre-workout: Peanut Butter Power Smoothie (1 cup almond milk + 1 scoop protein powder + 1 tsp peanut butter + ½ banana, ~25g protein, ~15g carbs)"
-            after_tips:
-              - "Within 60 mins: Greek yogurt with mixed berries (1 cup plain nonfat Greek yogurt + ½ cup mixed berries + 1 tbsp hemp seeds, ~25g protein, ~15g carbs)"
-      - date: "2025-04-05"
-        workouts:
-          - type: "Long Run"
-            title: "Endurance Builder"
-            summary: "Gradually extend time on feet with 25 minutes of 60 seconds run/60 seconds walk."
-            notes: "Hey Rosie! Today's long run involves 25 minutes of 60 seconds run/60 seconds walks. Look at you go! We've made so many gains in the last two weeks! Make sure to do your pre-run activation and post-run mobility as a thank you to your body. Then go celebrate a great training block with your friends or favorite things."
-            duration: 50
-            distance: null
-            focus: null
-            effort: "3"
-            steps:
-              - name: "Muscle Activation"
-                description: |
-                  - Toe Yoga: Lift big toe while lowering others, then reverse; 10 reps per foot
-                  - Heel Walks: Walk on heels with toes up; 30s x 3 rounds
-                  - Monster Walks: Band above knees, take wide steps sideways; 2x10 steps each way
-                  - Foam roll calves: Roll under calf muscles, pause on tight spots; 1-2 min
-              - name: "Running Workout"
-                description: |
-                  - 5 min warm-up walk
-                  - 25 min alternating 60s run / 60s walk
-                  - 5 min cool down walk
-              - name: "Post-Run Recovery"
-                description: |
-                  - Foam roll calves, quads, IT band: Roll slowly, pause on tender spots; 3-5 min
-                  - Static stretching: Quads, hamstrings, calves, glutes
-                  - Consider icing calves/shins for 15-20 minutes
-            before_tips:
-              - "60-90 mins pre-long run: Protein Oatmeal (⅓ cup oats cooked with water + ½ scoop protein powder + ½ banana, ~14g protein, ~30g carbs)"
-            after_tips:
-              - "Ideally within 30-60 mins: Weekend Celebration Brunch (Options: Vegetable frittata, protein French toast, savory breakfast bowl, or salmon avocado toast, ~25-30g protein, ~30-40g carbs)"
-              - "Take yourself to a fun brunch with friends to celebrate your consistency and awesome training over the last two weeks!"
-      - date: "2025-04-06"
-        workouts:
-          - type: "Rest and Recovery"
-            title: "Rest Day Relaxation"
-            summary: "Complete recovery day to allow your body to adapt to our first training sessions."
-            notes: "Hey Rosie! You're a rockstar. Congrats on making it through Week 2! If you're feeling tight or stiff, light stretching, yoga, or a stroll in your favorite park or neighborhood would be great. Epsom salt baths also work wonders for reducing inflammation and soothing sore muscles.
-            Light a candle and reflect on all you've accomplished! Text me and let me know how you're doing!"
-            duration: null
-            distance: null
-            focus: null
-            effort: "Rest"
-            steps: []
-            before_tips:
-              - "Protein is key for recovery: Prioritize protein from lean meats, fish, eggs, Greek yogurt, tofu, and legumes to aid in muscle repair and rebuilding."
-              - "Carbs and healthy fats support hormone health: Slow-digesting, fiber-rich carbs like sweet potatoes, oats, and brown rice and healthy fats from nuts, fish, olive oil, and avocados help support hormone health and inflammation reduction."
-              - "Listen to hunger cues: Make sure you're still eating plenty! Given that you just increased your activity level, you might be hungrier than usual, an indication that you're underfueling on training days. To be a strong, healthy runner, you need to be a well-fueled runner!"
-
-"""
+SHOT_1_OUTPUT_PATH = Path(__file__).parent / "shot_1_output.md"
+
+
+@lru_cache(maxsize=1)
+def get_shot_1_output():
+    """Return the example answer for SHOT_1_INPUT, read on first use."""
+    return SHOT_1_OUTPUT_PATH.read_text(encoding="utf-8")
+
+
+# The example exchange is static, so render its prompt once at import
+SHOT_1_PROMPT = TRAINING_PLAN_PROMPT.format(**SHOT_1_INPUT)
+
+
+@lru_cache(maxsize=1)
+def get_prompt_prefix():
+    """
+    Return the messages that precede the user's prompt, built once.
+
+    The system prompt and the example exchange never change, so the cache
+    breakpoint goes on the example answer: Anthropic then caches the whole
+    prefix and only the last message is processed per plan.
+    """
+    return (
+        {
+            "role": "system",
+            "content": get_training_plan_system_prompt()
+        },
+        {
+            "role": "user",
+            "content": SHOT_1_PROMPT
+        },
+        {
+            "role": "assistant",
+            "content": [
+                {
+                    "type": "text",
+                    "text": get_shot_1_output(),
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        },
+    )
+
+
+def validate_plan_data(plan_data):
+    """
+    Check that a parsed plan has the structure the save path reads.
+
+    Runs before anything is written, so a malformed response fails with a
+    clear message instead of a KeyError halfway through the workout inserts.
+
+    Raises:
+        ValueError: If a required key is missing or has the wrong type
+    """
+    def require(container, key, expected_type, where):
+        if not isinstance(container, dict) or key not in container:
+            raise ValueError(f"Plan is missing '{key}' in {where}")
+        if not isinstance(container[key], expected_type):
+            raise ValueError(f"Plan has an invalid '{key}' in {where}")
+        return container[key]
+
+    for key in ("reasoning", "goal", "sms_message"):
+        require(plan_data, key, str, "the plan")
+    for i, week in enumerate(require(plan_data, "weeks", list, "the plan")):
+        require(week, "goal", str, f"week {i}")
+        for j, day in enumerate(require(week, "dates", list, f"week {i}")):
+            require(day, "date", (str, datetime.date), f"week {i}, day {j}")
+            workouts = require(day, "workouts", list, f"week {i}, day {j}")
+            if not all(isinstance(workout, dict) for workout in workouts):
+                raise ValueError(f"Plan has an invalid workout in week {i}, day {j}")
 
 
 class TrainingPlanService:
@@ -2120,16 +523,7 @@ class TrainingPlanService:
     
     def run_prompt_one_shot(model, payload, **kwargs):
         messages = [
-            {
-                "role": "user",
-                "content": TRAINING_PLAN_PROMPT.format(
-                    **SHOT_1_INPUT
-                )
-            },
-            {
-                "role": "assistant",
-                "content": SHOT_1_OUTPUT
-            },
+            *get_prompt_prefix(),
             {
                 "role": "user",
                 "content": TRAINING_PLAN_PROMPT.format(
@@ -2160,53 +554,33 @@ class TrainingPlanService:
         try:
             twilio_service = TwilioMessagingService()
             twilio_service.send_sms(str(phone_number), message)
-            logger.info(f"Training plan notification sent to {phone_number} for plan '{plan_id}'")
+            logger.info("Training plan notification sent to %s for plan '%s'", phone_number, plan_id)
             return True
         except Exception as e:
-            logger.error(f"Failed to send training plan notification: {str(e)}")
+            logger.error("Failed to send training plan notification: %s", e)
             return False
     
     @classmethod
     def generate_training_plan(cls, plan) -> Optional[Dict]:
         """Generate a training plan for a user"""
-        user = plan.user
-
         try:
-            handler = get_langfuse_handler(plan, plan.user)
+            # Load the user together with the profile the prompt is built from
+            user = get_user_model().objects.select_related('profile').get(pk=plan.user_id)
+            plan.user = user
+
+            handler = get_langfuse_handler(plan, user)
             callbacks = [handler] if handler else None
 
-            # Validate input
-            if not user or not user.first_name or not user.profile or not user.profile.is_onboarding_complete:
-                raise ValidationError("User must have a first name, a profile and a completed onboarding")
-            
+            # The view and admin action only queue plans for onboarded users
+            # with a first name, so the profile is used as-is
             profile = user.profile
 
-            with transaction.atomic():
-                # If a plan generation is in progress, return None
-                if Plan.objects.filter(
-                    user=user,
-                    generation_completed_at__isnull=True,
-                    generation_error__isnull=True
-                ).exclude(
-                    id=plan.id
-                ).exists():
-                    logger.info(f"Training plan generation already in progress for user {user.id}")
-                    return None
-
             # Generate plan
-            model = init_chat_model(
-              cls.MODEL,
-              model_provider=cls.PROVIDER
-            )
-            model = model.with_retry(
-                retry_if_exception_type=(Exception,),
-                stop_after_attempt=3,
-                wait_exponential_jitter=True
-            )
+            model = get_chat_model(cls.MODEL, cls.PROVIDER)
             
             # Get the user's timezone
             user_timezone_str = profile.timezone or 'UTC'
-            user_tz = timezone(user_timezone_str)
+            user_tz = get_timezone(user_timezone_str)
             local_created_at = plan.created_at.astimezone(user_tz)
             
             today = local_created_at.date()
@@ -2215,7 +589,7 @@ class TrainingPlanService:
             next_next_sunday = next_sunday + datetime.timedelta(days=7)
 
             serialized_profile = ProfileSerializer(profile).data
-            serialized_profile['name'] = profile.user.first_name
+            serialized_profile['name'] = user.first_name
 
             payload = {
                 "today": today.isoformat(),
@@ -2248,7 +622,10 @@ class TrainingPlanService:
                 plan_data = parse_yaml_response_content(response.content, config=parse_config)
             else:
                 plan_data = parse_yaml_response_content(response.content[1]["text"], config=parse_config)
-            logger.info(json.dumps(plan_data, indent=2))
+            validate_plan_data(plan_data)
+            # The full plan is tens of KB; only serialize it when it will be logged
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Parsed training plan for plan %s: %s", plan.id, json.dumps(plan_data))
 
             # Save plans and workouts
             plan_info = {
@@ -2262,21 +639,24 @@ class TrainingPlanService:
                     } for week in plan_data["weeks"]
                 ]  # Exclude workouts
             }
-            plan.plan_info = plan_info
-            plan.save()
-            for week in plan_data["weeks"]:
-                for day in week["dates"]:
-                    for workout in day["workouts"]:
-                        Workout.objects.create(
-                            plan=plan,
-                            date=day["date"],
-                            workout_info=workout
-                    )
-
-            # Mark plan as completed
-            plan.mark_as_completed()
-
-            logger.info(f"Generated training plan for user {user.id}")
+            # Persist everything in one transaction so a bad workout can't leave
+            # a half-saved plan behind (this runs outside the request cycle, so
+            # ATOMIC_REQUESTS doesn't cover it)
+            with transaction.atomic():
+                plan.plan_info = plan_info
+                plan.save()
+                # One batched INSERT ... RETURNING instead of an INSERT per workout
+                Workout.bulk_create_for_plan(plan, (
+                    {"date": day["date"], "workout_info": workout}
+                    for week in plan_data["weeks"]
+                    for day in week["dates"]
+                    for workout in day["workouts"]
+                ), batch_size=200)
+
+                # Mark plan as completed
+                plan.mark_as_completed()
+
+            logger.info("Generated training plan for user %s", user.id)
             
             # Send notification
             cls.send_plan_notification(user.profile.phone_number, plan_data["sms_message"], plan.id)
@@ -2289,16 +669,17 @@ class TrainingPlanService:
                     event_name="Training Plan Generated",
                     properties={
                         "plan_id": str(plan.id)
-                    }
+                    },
+                    defer=True
                 )
             except Exception as e:
                 # Log error but continue with normal flow
-                logging.error(f"Error tracking Training Plan Generated event: {str(e)}")
+                logger.error("Error tracking Training Plan Generated event: %s", e)
 
             return plan
 
         except Exception as e:
-            error_message = f"Error generating training plan for user {user.id}: {str(e)}"
+            error_message = f"Error generating training plan for user {plan.user_id}: {str(e)}"
             stack_trace = traceback.format_exc()
 
             logger.error(error_message, exc_info=True)
@@ -2320,7 +701,10 @@ class TrainingPlanThreadManager:
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
-                    cls._instance._executor = ThreadPoolExecutor(max_workers=3)
+                    cls._instance._executor = ThreadPoolExecutor(
+                        max_workers=settings.PLAN_GENERATION_WORKERS,
+                        thread_name_prefix="plan-generation",
+                    )
         return cls._instance
 
     def generate_training_plan_async(self, user) -> None:
@@ -2331,6 +715,10 @@ class TrainingPlanThreadManager:
             user: User instance
         """
         try:
-            self._executor.submit(TrainingPlanService.generate_training_plan, user)
+            # Start once the plan row is committed, so the worker can see it
+            # and a rolled back request doesn't generate anything
+            transaction.on_commit(
+                lambda: self._executor.submit(TrainingPlanService.generate_training_plan, user)
+            )
         except Exception as e:
-            logger.error(f"Failed to submit training plan generation task: {str(e)}")
\ No newline at end of file
+            logger.error("Failed to submit training plan generation task: %s", e)
\ No newline at end of file
@@ -33,6 +33,14 @@ class TestPlanModel(TestCase):
             f"Plan for {self.user.email}"
         )
     
+    def test_plan_email_snapshot_follows_user_email(self):
+        """Test that changing the user's email updates the plan's snapshot."""
+        self.user.email = "renamed@example.com"
+        self.user.save()
+        self.plan.refresh_from_db(fields=['user_email_cached'])
+        self.assertEqual(self.plan.user_email_cached, "renamed@example.com")
+        self.assertEqual(str(self.plan), "Plan for renamed@example.com")
+    
     def test_plan_user_deletion_cascade(self):
         """Test that deleting a user cascades to delete related plans."""
         plan_id = self.plan.id
@@ -47,9 +55,29 @@ class TestPlanModel(TestCase):
     
     def test_plan_with_null_plan_info(self):
         """Test that a Plan can have null plan_info."""
-        plan = Plan.objects.create(user=self.user, plan_info=None)
+        plan = Plan.objects.create(user=self.user, plan_info=None, generation_completed_at=timezone.now())
         self.assertIsNone(plan.plan_info)
 
+    def test_plan_status_is_stored(self):
+        """Test that status is persisted and follows the generation state."""
+        self.assertEqual(self.plan.status, Plan.Status.IN_PROGRESS)
+
+        self.plan.mark_as_completed()
+        self.assertEqual(Plan.objects.get(id=self.plan.id).status, Plan.Status.COMPLETED)
+
+        self.plan.set_error("Something went wrong")
+        self.assertEqual(Plan.objects.get(id=self.plan.id).status, Plan.Status.ERROR)
+        self.assertTrue(Plan.objects.filter(status=Plan.Status.ERROR, id=self.plan.id).exists())
+
+    def test_create_pending(self):
+        """Test that create_pending refuses a second in-progress plan for a user."""
+        self.assertIsNone(Plan.objects.create_pending(self.user))
+
+        self.plan.mark_as_completed()
+        plan = Plan.objects.create_pending(self.user)
+        self.assertEqual(plan.user, self.user)
+        self.assertEqual(plan.status, Plan.Status.IN_PROGRESS)
+
 
 class TestWorkoutModel(TestCase):
     """
@@ -117,4 +145,28 @@ class TestWorkoutModel(TestCase):
         
         # Refresh from db
         self.workout.refresh_from_db()
-        self.assertEqual(self.workout.completion_status, "completed")
\ No newline at end of file
+        self.assertEqual(self.workout.completion_status, "completed")
+
+    def test_workout_info_fields_are_denormalized(self):
+        """Test that workout_type and duration_min are copied from workout_info."""
+        self.assertEqual(self.workout.workout_type, "run")
+        self.assertIsNone(self.workout.duration_min)
+
+        self.workout.workout_info = {"type": "Long Run", "duration": "45"}
+        self.workout.save()
+        self.workout.refresh_from_db()
+        self.assertEqual(self.workout.workout_type, "Long Run")
+        self.assertEqual(self.workout.duration_min, 45)
+
+    def test_bulk_create_for_plan(self):
+        """Test that bulk_create_for_plan creates all workouts for the plan."""
+        today = timezone.now().date()
+        workouts = Workout.bulk_create_for_plan(self.plan, [
+            {"date": today, "workout_info": {"type": "Easy Run"}},
+            {"date": today, "workout_info": {"type": "Strength Training"}},
+        ])
+
+        self.assertEqual(len(workouts), 2)
+        self.assertEqual(Workout.objects.filter(plan=self.plan).count(), 3)
+        self.assertTrue(all(workout.created_at for workout in workouts))
+        self.assertEqual(workouts[1].workout_type, "Strength Training")
@@ -2,16 +2,16 @@
 Tests for services in the plans app.
 """
 from unittest.mock import patch, MagicMock
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from api.plans.services import TrainingPlanService
 from api.users.test.factories import UserFactory
 from api.plans.models import Plan
 
 
-class TrainingPlanServiceTest(TestCase):
+class TrainingPlanNotificationTest(SimpleTestCase):
     """
-    Tests for the TrainingPlanService.
+    Tests for the TrainingPlanService SMS notification, which don't use the database.
     """
     
     def test_send_plan_notification_with_valid_phone_number(self):
@@ -53,6 +53,12 @@ class TrainingPlanServiceTest(TestCase):
         
         self.assertFalse(result)
 
+
+class TrainingPlanServiceTest(TestCase):
+    """
+    Tests for the TrainingPlanService.
+    """
+
     @patch('api.utils.mixpanel_service.MixpanelService.track')
     @patch('api.plans.services.TrainingPlanService.run_prompt_one_shot')
     @patch('api.plans.services.parse_yaml_response_content')
@@ -115,5 +121,59 @@ class TrainingPlanServiceTest(TestCase):
         mock_track.assert_called_once_with(
             distinct_id=str(user.id),
             event_name='Training Plan Generated',
-            properties={'plan_id': str(plan.id)}
+            properties={'plan_id': str(plan.id)},
+            defer=True
         )
+
+    @patch('api.plans.services.TrainingPlanService.run_prompt_one_shot')
+    @patch('api.plans.services.parse_yaml_response_content')
+    def test_malformed_plan_is_rejected_before_saving(self, mock_parse, mock_run_prompt_one_shot):
+        """Test that a plan missing workouts sets an error without writing plan_info or workouts."""
+        user = UserFactory(first_name="Alice")
+        profile = user.profile
+        profile.is_onboarding_complete = True
+        profile.save()
+        plan = Plan.objects.create(user=user)
+
+        mock_run_prompt_one_shot.return_value.content = "mocked-content-does-not-matter"
+        mock_parse.return_value = {
+            "reasoning": "Build aerobic base.",
+            "goal": "Half marathon",
+            "sms_message": "Your plan is ready!",
+            "weeks": [{"goal": "Base building", "dates": [{"date": "2025-03-25"}]}],
+        }
+
+        self.assertIsNone(TrainingPlanService().generate_training_plan(plan))
+
+        plan.refresh_from_db()
+        self.assertIn("'workouts'", plan.generation_error)
+        self.assertIsNone(plan.plan_info)
+        self.assertFalse(plan.workouts.exists())
+
+    @patch('api.plans.services.get_user_model')
+    def test_user_lookup_failure_marks_plan_as_errored(self, mock_get_user_model):
+        """Test that a failure loading the user still records the error on the plan."""
+        plan = Plan.objects.create(user=UserFactory())
+        mock_get_user_model.return_value.objects.select_related.return_value.get.side_effect = Exception("Database unavailable")
+
+        self.assertIsNone(TrainingPlanService().generate_training_plan(plan))
+
+        plan.refresh_from_db()
+        self.assertEqual(plan.status, Plan.Status.ERROR)
+        self.assertIn("Database unavailable", plan.generation_error)
+
+    def test_prompt_prefix_is_stable_across_requests(self):
+        """Test that only the last message depends on the payload, so the prefix stays cacheable."""
+        model = MagicMock()
+        payloads = [
+            {"today": "2025-04-01", "up_to_date": "2025-04-13", "plan_url": "https://example.com/plans/1", "profile": {"name": "Alice"}},
+            {"today": "2025-05-01", "up_to_date": "2025-05-11", "plan_url": "https://example.com/plans/2", "profile": {"name": "Beth"}},
+        ]
+        for payload in payloads:
+            TrainingPlanService.run_prompt_one_shot(model, payload)
+
+        first, second = (call.args[0] for call in model.invoke.call_args_list)
+        self.assertEqual(first[:-1], second[:-1])
+        self.assertNotEqual(first[-1], second[-1])
+        self.assertEqual(first[-2]["content"][-1]["cache_control"], {"type": "ephemeral"})
+        self.assertNotIn("Alice", first[0]["content"])
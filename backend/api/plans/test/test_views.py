@@ -1,17 +1,20 @@
 import uuid
 from unittest.mock import patch
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APITestCase, APIClient, force_authenticate
+from rest_framework.test import APITestCase, force_authenticate
 from datetime import date, timedelta
-from unittest import mock, TestCase
-import json
+from unittest import mock
 
 from api.plans.models import Plan, Workout
 from api.plans.test.factories import PlanFactory, WorkoutFactory
 from api.users.test.factories import UserFactory
 
 
+@patch('api.plans.services.TrainingPlanThreadManager.generate_training_plan_async')
 class TrainingPlanGenerateViewTests(APITestCase):
     """
     Test cases for the TrainingPlanGenerateView API endpoint.
@@ -25,7 +28,6 @@ class TrainingPlanGenerateViewTests(APITestCase):
         self.client.force_authenticate(user=self.user)
         self.url = reverse('generate-plan')
     
-    @patch('api.plans.services.TrainingPlanThreadManager.generate_training_plan_async')
     def test_generate_plan_success(self, mock_generate):
         """Test successful training plan generation."""
         # Arrange
@@ -40,13 +42,16 @@ class TrainingPlanGenerateViewTests(APITestCase):
         self.assertEqual(response.data['status'], 'in progress')
         self.assertEqual(response.data['message'], 'Training plan generation started')
         
-        # Verify the mock was called with the correct user
-        mock_generate.assert_called_once_with(Plan.objects.get(user=self.user))
+        # Verify generation was started for the plan that was created
+        mock_generate.assert_called_once()
+        plan = mock_generate.call_args[0][0]
+        self.assertEqual(plan.user_id, self.user.id)
+        self.assertEqual(str(plan.id), str(response.data['id']))
         
         # Verify a plan was created in the database
-        self.assertTrue(Plan.objects.filter(user=self.user).exists())
+        self.assertTrue(Plan.objects.filter(id=plan.id, user=self.user).exists())
     
-    def test_generate_plan_unauthenticated(self):
+    def test_generate_plan_unauthenticated(self, mock_generate):
         """Test that unauthenticated users cannot generate a plan."""
         # Arrange
         self.client.force_authenticate(user=None)
@@ -56,8 +61,8 @@ class TrainingPlanGenerateViewTests(APITestCase):
         
         # Assert
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        mock_generate.assert_not_called()
     
-    @patch('api.plans.services.TrainingPlanThreadManager.generate_training_plan_async')
     def test_generate_plan_incomplete_profile(self, mock_generate):
         """Test that users with incomplete profiles get a 400 error."""
         # Arrange
@@ -74,7 +79,18 @@ class TrainingPlanGenerateViewTests(APITestCase):
         # Verify the mock was NOT called
         mock_generate.assert_not_called()
     
-    @patch('api.plans.services.TrainingPlanThreadManager.generate_training_plan_async')
+    def test_generate_plan_missing_first_name(self, mock_generate):
+        """Test that users without a first name get a 400 error before a plan is queued."""
+        self.user.first_name = ''
+        self.user.save()
+
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], 'User first name is missing')
+        self.assertFalse(Plan.objects.filter(user=self.user).exists())
+        mock_generate.assert_not_called()
+    
     def test_generate_plan_already_in_progress(self, mock_generate):
         """Test that users cannot generate a new plan when one is already in progress."""
         # Arrange
@@ -94,7 +110,6 @@ class TrainingPlanGenerateViewTests(APITestCase):
         # Verify the mock was NOT called
         mock_generate.assert_not_called()
     
-    @patch('api.plans.services.TrainingPlanThreadManager.generate_training_plan_async')
     def test_generate_plan_server_error(self, mock_generate):
         """Test server error handling when an unexpected exception occurs."""
         # Arrange
@@ -117,10 +132,14 @@ class TrainingPlanGenerateViewTests(APITestCase):
 class PlanDetailViewTests(APITestCase):
     """Test cases for the Plan Detail API endpoint."""
     
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by the tests in this class."""
+        cls.user = UserFactory()
+        cls.plan = PlanFactory(user=cls.user)
+
     def setUp(self):
-        """Set up test data and authenticate the user."""
-        self.user = UserFactory()
-        self.plan = PlanFactory(user=self.user)
+        """Authenticate the user."""
         self.client.force_authenticate(user=self.user)
         self.url = reverse('plan-detail', kwargs={'plan_id': self.plan.id})
     
@@ -172,19 +191,23 @@ class PlanDetailViewTests(APITestCase):
 class WorkoutListViewTests(APITestCase):
     """Test cases for the Workout List API endpoint."""
     
-    def setUp(self):
-        """Set up test data and authenticate the user."""
-        self.user = UserFactory()
-        self.plan = PlanFactory(user=self.user)
-        self.client.force_authenticate(user=self.user)
-        self.url = reverse('workout-list', kwargs={'plan_id': self.plan.id})
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by the tests in this class."""
+        cls.user = UserFactory()
+        cls.plan = PlanFactory(user=cls.user)
 
-        # Create 60 workouts starting from a valid base date
+        # Create 60 workouts starting from a valid base date, in one batched INSERT
         base_date = date(2023, 1, 1)
-        self.workouts = [
-            WorkoutFactory(plan=self.plan, date=base_date + timedelta(days=i))
+        cls.workouts = Workout.bulk_create_for_plan(cls.plan, (
+            {"date": base_date + timedelta(days=i), "workout_info": {"type": "run", "distance": "5km"}}
             for i in range(60)
-        ]
+        ))
+
+    def setUp(self):
+        """Authenticate the user."""
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('workout-list', kwargs={'plan_id': self.plan.id})
     
     def test_get_workouts_success(self):
         """Test successfully retrieving a list of workouts."""
@@ -197,6 +220,45 @@ class WorkoutListViewTests(APITestCase):
         self.assertTrue(response.data['next'])  # Should have next page
         self.assertFalse(response.data['previous'])  # No previous page
     
+    def test_get_workouts_returns_summary(self):
+        """Test that list items only include the summary workout_info keys."""
+        # Act
+        response = self.client.get(self.url)
+        
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        workout_info = response.data['results'][0]['workout_info']
+        self.assertEqual(workout_info['type'], 'run')
+        self.assertEqual(workout_info['distance'], '5km')
+        self.assertNotIn('steps', workout_info)
+    
+    def test_get_workouts_summary_values(self):
+        """Test that summary values are returned as stored in workout_info."""
+        # Arrange
+        plan = PlanFactory(user=self.user, generation_completed_at=timezone.now())
+        WorkoutFactory(plan=plan, workout_info={
+            "type": "Long Run",
+            "title": "Sunday long run",
+            "summary": "Keep it conversational",
+            "duration": "90",
+            "distance": 10,
+            "steps": [{"name": "Run", "description": "10 miles easy"}],
+        })
+        url = reverse('workout-list', kwargs={'plan_id': plan.id})
+        
+        # Act
+        response = self.client.get(url)
+        
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['workout_info'], {
+            "type": "Long Run",
+            "title": "Sunday long run",
+            "summary": "Keep it conversational",
+            "duration": "90",
+            "distance": 10,
+        })
+    
     def test_get_workouts_with_date_range_filter(self):
         """Test filtering workouts by date."""
         # Arrange
@@ -216,7 +278,7 @@ class WorkoutListViewTests(APITestCase):
         """Test getting workouts when none exist."""
         # Arrange
         # Create a new plan with no workouts
-        empty_plan = PlanFactory(user=self.user)
+        empty_plan = PlanFactory(user=self.user, generation_completed_at=timezone.now())
         url = reverse('workout-list', kwargs={'plan_id': empty_plan.id})
         
         # Act
@@ -272,14 +334,30 @@ class WorkoutListViewTests(APITestCase):
         self.assertFalse(response.data['next'])  # No next page
         self.assertTrue(response.data['previous'])  # Should have previous page
 
+    def test_query_count_does_not_depend_on_page_size(self):
+        """Test that listing workouts doesn't issue a query per workout."""
+        with CaptureQueriesContext(connection) as full_page:
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.data['results']), 50)
+
+        with CaptureQueriesContext(connection) as single_row:
+            response = self.client.get(f"{self.url}?start_date=2023-01-15&end_date=2023-01-15")
+        self.assertEqual(len(response.data['results']), 1)
+
+        self.assertEqual(len(full_page), len(single_row))
+
 class WorkoutDetailViewTests(APITestCase):
     """Test cases for the Workout Detail API endpoint."""
     
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by the tests in this class."""
+        cls.user = UserFactory()
+        cls.plan = PlanFactory(user=cls.user)
+        cls.workout = WorkoutFactory(plan=cls.plan)
+
     def setUp(self):
-        """Set up test data and authenticate the user."""
-        self.user = UserFactory()
-        self.plan = PlanFactory(user=self.user)
-        self.workout = WorkoutFactory(plan=self.plan)
+        """Authenticate the user."""
         self.client.force_authenticate(user=self.user)
         self.url = reverse('workout-detail', kwargs={
             'plan_id': self.plan.id,
@@ -296,6 +374,23 @@ class WorkoutDetailViewTests(APITestCase):
         self.assertEqual(str(response.data['id']), str(self.workout.id))
         self.assertEqual(response.data['workout_info'], self.workout.workout_info)
     
+    def test_get_workout_queries(self):
+        """Test that the ownership checks don't load the user or plan one row at a time."""
+        with self.assertNumQueries(4):
+            # SAVEPOINT and RELEASE from ATOMIC_REQUESTS, the plan ownership
+            # check, and the workout joined with its plan
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_get_workout_does_not_load_plan_info(self):
+        """Test that the plan joined for the ownership check is loaded without its plan_info."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(any('plan_info' in query['sql'] for query in queries))
+
     def test_get_workout_unauthenticated(self):
         """Test that unauthenticated users cannot access a workout."""
         # Arrange
@@ -337,7 +432,7 @@ class WorkoutDetailViewTests(APITestCase):
     def test_get_workout_wrong_plan(self):
         """Test accessing a workout with the wrong plan ID."""
         # Arrange
-        other_plan = PlanFactory(user=self.user)
+        other_plan = PlanFactory(user=self.user, generation_completed_at=timezone.now())
         url = reverse('workout-detail', kwargs={
             'plan_id': other_plan.id,
             'workout_id': self.workout.id
@@ -359,11 +454,7 @@ class WorkoutDetailViewTests(APITestCase):
         }
         
         # Act
-        response = self.client.patch(
-            self.url,
-            data=json.dumps(data),
-            content_type='application/json'
-        )
+        response = self.client.patch(self.url, data, format='json')
         
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -372,10 +463,10 @@ class WorkoutDetailViewTests(APITestCase):
         self.assertEqual(response.data["additional_notes"], "This was a great workout!")
         
         # Verify the changes were saved to the database
-        updated_workout = Workout.objects.get(id=self.workout.id)
-        self.assertEqual(updated_workout.completion_status, "completed")
-        self.assertEqual(updated_workout.difficulty, 8)
-        self.assertEqual(updated_workout.additional_notes, "This was a great workout!")
+        self.workout.refresh_from_db(fields=['completion_status', 'difficulty', 'additional_notes'])
+        self.assertEqual(self.workout.completion_status, "completed")
+        self.assertEqual(self.workout.difficulty, 8)
+        self.assertEqual(self.workout.additional_notes, "This was a great workout!")
 
     def test_patch_workout_partial_update(self):
         """Test updating only some fields of a workout."""
@@ -385,21 +476,19 @@ class WorkoutDetailViewTests(APITestCase):
         }
         
         # Act
-        response = self.client.patch(
-            self.url,
-            data=json.dumps(data),
-            content_type='application/json'
-        )
+        response = self.client.patch(self.url, data, format='json')
         
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["completion_status"], "modified")
         
         # Verify other fields weren't changed
-        updated_workout = Workout.objects.get(id=self.workout.id)
-        self.assertEqual(updated_workout.completion_status, "modified")
-        self.assertEqual(updated_workout.difficulty, self.workout.difficulty)
-        self.assertEqual(updated_workout.additional_notes, self.workout.additional_notes)
+        original_difficulty = self.workout.difficulty
+        original_notes = self.workout.additional_notes
+        self.workout.refresh_from_db(fields=['completion_status', 'difficulty', 'additional_notes'])
+        self.assertEqual(self.workout.completion_status, "modified")
+        self.assertEqual(self.workout.difficulty, original_difficulty)
+        self.assertEqual(self.workout.additional_notes, original_notes)
 
     def test_patch_workout_invalid_completion_status(self):
         """Test updating a workout with an invalid completion status."""
@@ -409,11 +498,7 @@ class WorkoutDetailViewTests(APITestCase):
         }
         
         # Act
-        response = self.client.patch(
-            self.url,
-            data=json.dumps(data),
-            content_type='application/json'
-        )
+        response = self.client.patch(self.url, data, format='json')
         
         # Assert
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -427,11 +512,7 @@ class WorkoutDetailViewTests(APITestCase):
         }
         
         # Act
-        response = self.client.patch(
-            self.url,
-            data=json.dumps(data),
-            content_type='application/json'
-        )
+        response = self.client.patch(self.url, data, format='json')
         
         # Assert
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -443,11 +524,7 @@ class WorkoutDetailViewTests(APITestCase):
         }
         
         # Act
-        response = self.client.patch(
-            self.url,
-            data=json.dumps(data),
-            content_type='application/json'
-        )
+        response = self.client.patch(self.url, data, format='json')
         
         # Assert
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -463,11 +540,7 @@ class WorkoutDetailViewTests(APITestCase):
         }
         
         # Act
-        response = self.client.patch(
-            self.url,
-            data=json.dumps(data),
-            content_type='application/json'
-        )
+        response = self.client.patch(self.url, data, format='json')
         
         # Assert
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -485,11 +558,7 @@ class WorkoutDetailViewTests(APITestCase):
         }
         
         # Act
-        response = self.client.patch(
-            url,
-            data=json.dumps(data),
-            content_type='application/json'
-        )
+        response = self.client.patch(url, data, format='json')
         
         # Assert
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -500,20 +569,19 @@ class WorkoutDetailViewTests(APITestCase):
         data = {}
         
         # Act
-        response = self.client.patch(
-            self.url,
-            data=json.dumps(data),
-            content_type='application/json'
-        )
+        response = self.client.patch(self.url, data, format='json')
         
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Verify nothing changed
-        updated_workout = Workout.objects.get(id=self.workout.id)
-        self.assertEqual(updated_workout.completion_status, self.workout.completion_status)
-        self.assertEqual(updated_workout.difficulty, self.workout.difficulty)
-        self.assertEqual(updated_workout.additional_notes, self.workout.additional_notes)
+        original_status = self.workout.completion_status
+        original_difficulty = self.workout.difficulty
+        original_notes = self.workout.additional_notes
+        self.workout.refresh_from_db(fields=['completion_status', 'difficulty', 'additional_notes'])
+        self.assertEqual(self.workout.completion_status, original_status)
+        self.assertEqual(self.workout.difficulty, original_difficulty)
+        self.assertEqual(self.workout.additional_notes, original_notes)
 
     def test_patch_workout_ignore_workout_info_and_date(self):
         """Test that workout_info and date fields are not updated."""
@@ -529,20 +597,16 @@ class WorkoutDetailViewTests(APITestCase):
         }
         
         # Act
-        response = self.client.patch(
-            self.url,
-            data=json.dumps(data),
-            content_type='application/json'
-        )
+        response = self.client.patch(self.url, data, format='json')
         
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["completion_status"], "completed")
         
         # Verify workout_info and date weren't changed
-        updated_workout = Workout.objects.get(id=self.workout.id)
-        self.assertEqual(updated_workout.workout_info, original_workout_info)
-        self.assertEqual(updated_workout.date, original_date)
+        self.workout.refresh_from_db(fields=['workout_info', 'date'])
+        self.assertEqual(self.workout.workout_info, original_workout_info)
+        self.assertEqual(self.workout.date, original_date)
     
     def test_put_method_not_allowed(self):
         """Test that PUT method is not allowed."""
@@ -554,28 +618,26 @@ class WorkoutDetailViewTests(APITestCase):
         }
         
         # Act
-        response = self.client.put(
-            self.url,
-            data=json.dumps(data),
-            content_type='application/json'
-        )
+        response = self.client.put(self.url, data, format='json')
         
         # Assert
         self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
 
-class WorkoutDetailViewTestCase(TestCase):
+class WorkoutDetailViewTestCase(APITestCase):
     # ... existing tests ...
     
-    def setUp(self):
-        self.user = UserFactory()
-        self.plan = Plan.objects.create(user=self.user)
-        self.workout = Workout.objects.create(
-            plan=self.plan,
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory()
+        cls.plan = Plan.objects.create(user=cls.user)
+        cls.workout = Workout.objects.create(
+            plan=cls.plan,
             date=date.today(),
             workout_info={'type': 'Easy Run'},
             completion_status=Workout.CompletionStatus.NOT_COMPLETED
         )
-        self.client = APIClient()
+
+    def setUp(self):
         self.client.force_authenticate(user=self.user)
         self.url = reverse('workout-detail', kwargs={
             'plan_id': self.plan.id,
@@ -12,7 +12,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.pagination import PageNumberPagination
 from api.plans.models import Plan, Workout
 from api.plans.services import TrainingPlanThreadManager
-from api.plans.serializers import PlanSerializer, WorkoutSerializer
+from api.plans.serializers import PlanSerializer, WorkoutSerializer, WorkoutSummarySerializer
 from api.users.permissions import IsPlanOwner
 from api.utils.mixpanel_service import MixpanelService
 
@@ -43,21 +43,22 @@ class TrainingPlanGenerateView(APIView):
                     {"error": "User profile is incomplete or missing"},
                     status=status.HTTP_400_BAD_REQUEST
                 )
+
+            # The plan prompt addresses the user by name
+            if not user.first_name:
+                return Response(
+                    {"error": "User first name is missing"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
             
-            # Check if a plan is already being generated for this user
-            if Plan.objects.filter(
-                user=user, 
-                generation_completed_at__isnull=True, 
-                generation_error__isnull=True
-            ).exists():
+            # Create a new plan unless one is already being generated for this user
+            plan = Plan.objects.create_pending(user)
+            if plan is None:
                 return Response(
                     {"error": "A training plan is already being generated for this user"},
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Create a new plan
-            plan = Plan.objects.create(user=user)
-            
             # Start async generation
             TrainingPlanThreadManager().generate_training_plan_async(plan)
             
@@ -65,7 +66,7 @@ class TrainingPlanGenerateView(APIView):
             return Response(
                 {
                     "id": plan.id,
-                    "status": "in progress",
+                    "status": plan.status,
                     "message": "Training plan generation started"
                 },
                 status=status.HTTP_201_CREATED
@@ -114,12 +115,13 @@ class WorkoutListView(generics.ListAPIView):
     """
     List workouts for a specific training plan.
     
-    Returns all attributes of the Workout model for each item.
+    Returns a summary of each workout; the full workout_info is available
+    from the workout detail endpoint.
     Implements pagination with 50 items per page.
     Includes filter by date in YYYY-MM-DD format.
     Ensures the plan belongs to the requesting user.
     """
-    serializer_class = WorkoutSerializer
+    serializer_class = WorkoutSummarySerializer
     permission_classes = [IsAuthenticated, IsPlanOwner]
     pagination_class = WorkoutPagination
     
@@ -129,7 +131,7 @@ class WorkoutListView(generics.ListAPIView):
         Also filter by a date range if start_date and end_date are provided.
         """
         plan_id = self.kwargs.get('plan_id')
-        queryset = Workout.objects.filter(plan_id=plan_id)
+        queryset = self.serializer_class.prepare_queryset(Workout.objects.filter(plan_id=plan_id))
 
         # Range filter: start_date and end_date
         start_date_str = self.request.query_params.get('start_date')
@@ -175,8 +177,13 @@ class WorkoutDetailView(generics.RetrieveUpdateAPIView):
         plan_id = self.kwargs.get('plan_id')
         workout_id = self.kwargs.get('workout_id')
         
-        # The IsPlanOwner permission already checks if plan belongs to user
-        workout = get_object_or_404(Workout, id=workout_id, plan_id=plan_id)
+        # The IsPlanOwner permission already checks if plan belongs to user;
+        # join the plan (without its plan_info) for the object-level check
+        workout = get_object_or_404(
+            Workout.objects.select_related('plan').defer('plan__plan_info'),
+            id=workout_id,
+            plan_id=plan_id
+        )
         self.check_object_permissions(self.request, workout)
         return workout
     
@@ -220,7 +227,6 @@ class WorkoutDetailView(generics.RetrieveUpdateAPIView):
         if (original_completion_status == Workout.CompletionStatus.NOT_COMPLETED and 
             new_completion_status != Workout.CompletionStatus.NOT_COMPLETED):
             try:
-                # Extract workout type from workout_info
                 workout_type = updated_instance.workout_info.get('type', 'Unknown') if updated_instance.workout_info else 'Unknown'
                 
                 # Track the workout completion event
@@ -236,7 +242,8 @@ class WorkoutDetailView(generics.RetrieveUpdateAPIView):
                         "completion_status": updated_instance.completion_status,
                         "additional_notes": updated_instance.additional_notes
                     },
-                    request=request
+                    request=request,
+                    defer=True
                 )
             except Exception as e:
                 # Log error but continue with normal flow
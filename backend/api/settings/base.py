@@ -314,4 +314,8 @@ LANGFUSE_HOST = env("LANGFUSE_HOST", default="https://us.cloud.langfuse.com")
 
 # Mixpanel
 MIXPANEL_PROJECT_TOKEN = env("MIXPANEL_PROJECT_TOKEN", default="")
-MIXPANEL_ENABLED = env.bool("MIXPANEL_ENABLED", default=True)
\ No newline at end of file
+MIXPANEL_ENABLED = env.bool("MIXPANEL_ENABLED", default=True)
+# Training plan generation
+# ------------------------------------------------------------------------------
+# Size of the background thread pool running plan generation (one LLM call each)
+PLAN_GENERATION_WORKERS = env.int("PLAN_GENERATION_WORKERS", default=3)
@@ -21,6 +21,11 @@ TEST_RUNNER = "django.test.runner.DiscoverRunner"
 # https://docs.djangoproject.com/en/dev/ref/settings/#password-hashers
 PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 
+# MIXPANEL
+# ------------------------------------------------------------------------------
+# Tests that check tracking either patch MixpanelService.track or override this
+MIXPANEL_ENABLED = False
+
 # EMAIL
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#email-backend
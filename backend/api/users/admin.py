@@ -118,19 +118,17 @@ class UserAdmin(DefaultUserAdmin):
                     failed += 1
                     messages.warning(request, f"User {user.email} has an incomplete profile.")
                     continue
+                if not user.first_name:
+                    failed += 1
+                    messages.warning(request, f"User {user.email} has no first name.")
+                    continue
                 
-                # Check if a plan is already being generated
-                if Plan.objects.filter(
-                    user=user, 
-                    generation_completed_at__isnull=True, 
-                    generation_error__isnull=True
-                ).exists():
+                # Create a new plan unless one is already being generated
+                plan = Plan.objects.create_pending(user)
+                if plan is None:
                     failed += 1
                     messages.warning(request, f"A plan is already being generated for {user.email}.")
                     continue
-
-                # Create a new plan
-                plan = Plan.objects.create(user=user)
                 
                 # Start async generation
                 TrainingPlanThreadManager().generate_training_plan_async(plan)
@@ -240,7 +240,8 @@ class Profile(models.Model):
                 mixpanel_service = MixpanelService()
                 mixpanel_service.track(
                     distinct_id=str(self.user.id),
-                    event_name="Onboarding Completed"
+                    event_name="Onboarding Completed",
+                    defer=True
                 )
             except Exception as e:
                 # Log error but continue with normal flow
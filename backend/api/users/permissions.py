@@ -33,7 +33,8 @@ class IsPlanOwner(permissions.BasePermission):
     
     def has_object_permission(self, request, view, obj):
         # For workout detail view, check if the plan belongs to the user
+        # Compare the foreign key so the user row isn't loaded
         if hasattr(obj, 'plan'):
-            return str(obj.plan.user.id) == str(request.user.id)
+            return str(obj.plan.user_id) == str(request.user.id)
         # For plan detail view
-        return str(obj.user.id) == str(request.user.id)
\ No newline at end of file
+        return str(obj.user_id) == str(request.user.id)
\ No newline at end of file
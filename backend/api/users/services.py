@@ -1,5 +1,6 @@
 import logging
 import re
+from functools import lru_cache
 from typing import Optional, Tuple, Dict, Any
 
 from django.conf import settings
@@ -8,6 +9,18 @@ from twilio.base.exceptions import TwilioRestException
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=4)
+def get_twilio_client(account_sid: str, auth_token: str) -> Client:
+    """
+    Return a Twilio client for the given credentials, shared by the process.
+
+    The client keeps its HTTP session, so reusing it keeps the connection to
+    the Twilio API alive between messages instead of a new TLS handshake each.
+    """
+    return Client(account_sid, auth_token)
+
+
 class TwilioMessagingService:
     """
     Service for sending SMS messages via Twilio.
@@ -105,8 +118,8 @@ class TwilioMessagingService:
             logger.error(f"Invalid phone number format: {to_number}")
             raise ValueError(f"Invalid phone number format: {to_number}. Must be in E.164 format (e.g., +12025550109).")
         
-        # Create Twilio client
-        client = Client(self.account_sid, self.auth_token)
+        # Get the shared Twilio client
+        client = get_twilio_client(self.account_sid, self.auth_token)
         
         try:
             logger.debug(f"Sending SMS to {to_number} from {self.from_number}")
@@ -198,8 +211,8 @@ class TwilioMessagingService:
             logger.info("Twilio Verify Service SID missing. Check TWILIO_VERIFY_SERVICE_SID.")
             raise ValueError("Twilio Verify Service SID missing. Check TWILIO_VERIFY_SERVICE_SID.")
         
-        # Create Twilio client
-        client = Client(self.account_sid, self.auth_token)
+        # Get the shared Twilio client
+        client = get_twilio_client(self.account_sid, self.auth_token)
         
         try:
             logger.info(f"Sending verification code to {phone_number} via {channel}")
@@ -253,8 +266,8 @@ class TwilioMessagingService:
             logger.error("Twilio Verify Service SID missing. Check TWILIO_VERIFY_SERVICE_SID.")
             raise ValueError("Twilio Verify Service SID missing. Check TWILIO_VERIFY_SERVICE_SID.")
         
-        # Create Twilio client
-        client = Client(self.account_sid, self.auth_token)
+        # Get the shared Twilio client
+        client = get_twilio_client(self.account_sid, self.auth_token)
         
         try:
             logger.debug(f"Checking verification code for {phone_number}")
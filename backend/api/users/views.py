@@ -205,7 +205,8 @@ class VerificationCodeView(APIView):
                     "phone_number_last_4": last_four_digits,
                     "verification_method": "twilio_verify" if use_twilio_verify else "legacy"
                 },
-                request=request
+                request=request,
+                defer=True
             )
         except Exception as e:
             # Log error but continue with normal flow
@@ -362,7 +363,8 @@ class VerifyCodeView(APIView):
                     properties={
                         "verification_method": "twilio_verify" if use_twilio_verify else "legacy"
                     },
-                    request=request
+                    request=request,
+                    defer=True
                 )
             except Exception as e:
                 # Log error but continue with normal flow
@@ -0,0 +1,19 @@
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The first 48 bits are the Unix timestamp in milliseconds and the rest is
+    random, so new primary keys land at the end of the index instead of at a
+    random leaf like uuid4 keys do.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), 'big')
+    # Version (bits 76-79) and RFC 4122 variant (bits 62-63)
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
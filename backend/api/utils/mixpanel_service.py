@@ -1,18 +1,51 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 from django.conf import settings
-from mixpanel import Mixpanel
+from django.db import transaction
+from mixpanel import Consumer, Mixpanel
 from django.http import HttpRequest
 from user_agents import parse
 import time
 
 logger = logging.getLogger(__name__)
 
+_lock = threading.Lock()
+_consumer = None
+_executor = None
+
+
+def get_consumer() -> Consumer:
+    """
+    Return the Mixpanel consumer shared by every MixpanelService.
+
+    The consumer owns the urllib3 connection pool, so sharing it keeps
+    connections to the Mixpanel API alive across events.
+    """
+    global _consumer
+    if _consumer is None:
+        with _lock:
+            if _consumer is None:
+                _consumer = Consumer()
+    return _consumer
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the single background thread used to send deferred events."""
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mixpanel")
+    return _executor
+
+
 class MixpanelService:
     """Service class for Mixpanel event tracking"""
     
     def __init__(self):
-        self.mp = Mixpanel(settings.MIXPANEL_PROJECT_TOKEN)
+        self.mp = Mixpanel(settings.MIXPANEL_PROJECT_TOKEN, consumer=get_consumer())
         self.enabled = settings.MIXPANEL_ENABLED
 
     def _get_user_metadata(self, request: Optional[HttpRequest] = None) -> Dict:
@@ -39,8 +72,14 @@ class MixpanelService:
         
         return metadata
 
-    def track(self, distinct_id: str, event_name: str, properties: Dict = None, request: HttpRequest = None):
-        """Track an event in Mixpanel"""
+    def track(self, distinct_id: str, event_name: str, properties: Dict = None, request: HttpRequest = None, defer: bool = False):
+        """
+        Track an event in Mixpanel
+
+        With defer=True the HTTP call to Mixpanel is made on a background
+        thread once the current transaction commits, so request handlers don't
+        wait on it (and rolled back requests don't report events).
+        """
         if not self.enabled:
             return
         
@@ -52,6 +91,18 @@ class MixpanelService:
                 **(properties or {})
             }
             
+            if defer:
+                transaction.on_commit(
+                    lambda: get_executor().submit(self._send, distinct_id, event_name, event_properties)
+                )
+            else:
+                self.mp.track(distinct_id, event_name.title(), event_properties)
+        except Exception as e:
+            logger.error(f"Error tracking Mixpanel event {event_name}: {str(e)}")
+
+    def _send(self, distinct_id: str, event_name: str, event_properties: Dict):
+        """Send a deferred event, logging instead of raising on failure"""
+        try:
             self.mp.track(distinct_id, event_name.title(), event_properties)
         except Exception as e:
             logger.error(f"Error tracking Mixpanel event {event_name}: {str(e)}")
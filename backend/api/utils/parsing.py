@@ -1,9 +1,19 @@
+import logging
 import re
 
 import yaml
-from langchain_openai import ChatOpenAI
 from api.utils.tracing import get_langfuse_handler
 
+logger = logging.getLogger(__name__)
+
+# libyaml's loader is several times faster on multi-KB plans; fall back to the
+# pure-Python one when PyYAML was built without it
+try:
+    YAML_LOADER = yaml.CSafeLoader
+except AttributeError:
+    YAML_LOADER = yaml.SafeLoader
+    logger.warning("PyYAML was built without libyaml; plan responses will be parsed with the slower pure-Python loader")
+
 
 def preprocess_yaml(input_text):
     """Extract the YAML block from the input text."""
@@ -62,7 +72,7 @@ def parse_yaml_response_content(
         yaml_text = postprocess_yaml(yaml_text)
 
     try:
-        output = yaml.safe_load(yaml_text)
+        output = yaml.load(yaml_text, Loader=YAML_LOADER)
         if output is None:
             msg = f"YAML block is empty. Content:\n{content}"
             raise ValueError(msg)
@@ -73,6 +83,9 @@ def parse_yaml_response_content(
             raise ValueError(msg)
 
         print(f"Error parsing YAML: {e}")
+        # Only needed on this fallback path, so don't pay for the import upfront
+        from langchain_openai import ChatOpenAI
+
         # Use a language model to reformat the YAML block
         model = ChatOpenAI(
             temperature=0.0, model_name="gpt-4o-mini", max_tokens=16384
@@ -0,0 +1,24 @@
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from api.utils.ids import uuid7
+
+
+class TestUUID7(TestCase):
+    def test_version_and_variant(self):
+        value = uuid7()
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, "specified in RFC 4122")
+
+    def test_embeds_timestamp(self):
+        with patch('api.utils.ids.time.time_ns', return_value=1_700_000_000_123_000_000):
+            value = uuid7()
+        self.assertEqual(value.int >> 80, 1_700_000_000_123)
+
+    def test_sorted_by_creation_time(self):
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        self.assertLess(first, second)
+        self.assertNotEqual(uuid7(), uuid7())
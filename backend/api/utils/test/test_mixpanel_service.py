@@ -54,3 +54,27 @@ class TestMixpanelService(TestCase):
         self.assertEqual(args[0], str(self.user.id))
         self.assertEqual(args[1], 'Test Event')
         self.assertIn('custom', args[2])
+
+    @override_settings(MIXPANEL_ENABLED=True)
+    @patch('api.utils.mixpanel_service.get_executor')
+    @patch('api.utils.mixpanel_service.Mixpanel')
+    def test_deferred_track_sends_after_commit(self, mock_mixpanel_class, mock_get_executor):
+        mock_mp_instance = MagicMock()
+        mock_mixpanel_class.return_value = mock_mp_instance
+        # Run submitted work inline
+        mock_get_executor.return_value.submit.side_effect = lambda fn, *args: fn(*args)
+
+        service = MixpanelService()
+        service.enabled = True  # Ensure tracking is active
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            service.track(str(self.user.id), 'Test Event', {'custom': 'data'}, defer=True)
+
+        mock_mp_instance.track.assert_not_called()
+        self.assertEqual(len(callbacks), 1)
+
+        callbacks[0]()
+        mock_mp_instance.track.assert_called_once()
+        args = mock_mp_instance.track.call_args[0]
+        self.assertEqual(args[1], 'Test Event')
+        self.assertIn('custom', args[2])